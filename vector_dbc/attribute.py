@@ -20,38 +20,72 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
+
 from . import attribute_definition
 
 
 class AttributeMixin(object):
+    __slots__ = ()
+
     dbc = None
     _marker = ''
 
     def _get_attribute(self, attr_name):
-        if attr_name in self.dbc.attributes:
-            value = self.dbc.attributes[attr_name].value
+        attr = self.dbc.attributes.get(attr_name)
+        if attr is not None:
+            return attr.value
 
-            return value
+    def _get_enum_attribute(self, attr_name):
+        attr = self.dbc.attributes.get(attr_name)
+        if attr is not None:
+            return attr.definition.choices[attr.value]
 
-    def _set_yes_no_attribute(self, attr_name, value):
-        if attr_name in self.dbc.attributes:
-            self.dbc.attributes[attr_name].value = value
-        else:
+    def _get_attribute_definition(self, attr_name, **kwargs):
+        definition = self.dbc.attribute_definitions.get(attr_name)
+
+        if definition is None:
+            # the choices passed in are the shared module constants, each
+            # definition gets a copy that it can change in place
+            if kwargs.get('choices') is not None:
+                kwargs['choices'] = kwargs['choices'].copy()
 
-            if attr_name in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions[attr_name]
-            else:
+            definition = attribute_definition.AttributeDefinition(
+                attr_name,
+                kind=self._marker,
+                **kwargs
+            )
+            self.dbc.attribute_definitions[attr_name] = definition
 
-                definition = attribute_definition.AttributeDefinition(
-                    attr_name,
-                    default_value=0,
-                    kind=self._marker,
-                    type_name='ENUM',
-                    choices={0: 'No', 1: 'Yes'}
-                )
-                self.dbc.attribute_definitions[attr_name] = definition
+        return definition
 
-            self.dbc.attributes[attr_name] = Attribute(int(value), definition)
+    def _set_yes_no_attribute(self, attr_name, value):
+        attr = self.dbc.attributes.get(attr_name)
+        if attr is not None:
+            attr.value = int(value)
+            return
+
+        definition = self._get_attribute_definition(
+            attr_name,
+            default_value=0,
+            type_name='ENUM',
+            choices=attribute_definition.YES_NO_CHOICES
+        )
+        self.dbc.attributes[definition.name] = Attribute(int(value), definition)
+
+    def _set_enum_attribute(self, attr_name, choices, value, default_value=0):
+        attr = self.dbc.attributes.get(attr_name)
+        if attr is not None:
+            attr.value = attr.definition._choice_value(value)
+            return
+
+        definition = self._get_attribute_definition(
+            attr_name,
+            default_value=default_value,
+            type_name='ENUM',
+            choices=choices
+        )
+        self.dbc.attributes[definition.name] = Attribute(definition._choice_value(value), definition)
 
     def _set_hex_attribute(self, attr_name, minimum, maximum, value):
         self._set_attribute(attr_name, minimum, maximum, value, 'HEX')
@@ -60,47 +94,39 @@ class AttributeMixin(object):
         self._set_attribute(attr_name, minimum, maximum, value, 'INT')
 
     def _set_str_attribute(self, attr_name, value):
-        if attr_name in self.dbc.attributes:
-            self.dbc.attributes[attr_name].value = value
-        else:
-            if attr_name in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions[attr_name]
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    attr_name,
-                    default_value='',
-                    kind=self._marker,
-                    type_name='STRING',
-                )
-                self.dbc.attribute_definitions[attr_name] = definition
-
-            self.dbc.attributes[attr_name] = Attribute(value, definition)
+        attr = self.dbc.attributes.get(attr_name)
+        if attr is not None:
+            attr.value = value
+            return
+
+        definition = self._get_attribute_definition(
+            attr_name,
+            default_value='',
+            type_name='STRING',
+        )
+        self.dbc.attributes[definition.name] = Attribute(value, definition)
 
     def _set_attribute(self, attr_name, minimum, maximum, value, type_):
-        if attr_name in self.dbc.attributes:
-            self.dbc.attributes[attr_name].value = value
-        else:
-            if attr_name in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions[attr_name]
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    attr_name,
-                    default_value=0,
-                    kind=self._marker,
-                    type_name=type_,
-                    minimum=minimum,
-                    maximum=maximum
-                )
-                self.dbc.attribute_definitions[attr_name] = definition
-
-            self.dbc.attributes[attr_name] = Attribute(value, definition)
+        attr = self.dbc.attributes.get(attr_name)
+        if attr is not None:
+            attr.value = value
+            return
+
+        definition = self._get_attribute_definition(
+            attr_name,
+            default_value=0,
+            type_name=type_,
+            minimum=minimum,
+            maximum=maximum
+        )
+        self.dbc.attributes[definition.name] = Attribute(value, definition)
 
 
 class Attribute(object):
     """An attribute that can be associated with nodes/messages/signals."""
 
+    __slots__ = ('_value', '_definition')
+
     def __init__(self, value, definition):
         self._value = value
         self._definition = definition
@@ -123,3 +149,79 @@ class Attribute(object):
     def definition(self):
         """The attribute definition."""
         return self._definition
+
+
+class AttributeProperty(object):
+    """
+    A property that reads and writes a string attribute of the owning
+    :class:`AttributeMixin`.
+    """
+
+    def __init__(self, attr_name, doc=None):
+        # same object as the keys the loader interns in dbc.attributes
+        self._attr_name = sys.intern(attr_name)
+        self.__doc__ = doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        return obj._get_attribute(self._attr_name)
+
+    def __set__(self, obj, value):
+        obj._set_str_attribute(self._attr_name, value)
+
+
+class IntAttributeProperty(AttributeProperty):
+    """A property for an integer attribute limited to `minimum` and `maximum`."""
+
+    _type_name = 'INT'
+
+    def __init__(self, attr_name, minimum, maximum, doc=None):
+        AttributeProperty.__init__(self, attr_name, doc)
+        self._minimum = minimum
+        self._maximum = maximum
+
+    def __set__(self, obj, value):
+        obj._set_attribute(
+            self._attr_name,
+            self._minimum,
+            self._maximum,
+            value,
+            self._type_name
+        )
+
+
+class HexAttributeProperty(IntAttributeProperty):
+    """A property for a hex attribute limited to `minimum` and `maximum`."""
+
+    _type_name = 'HEX'
+
+
+class BoolAttributeProperty(IntAttributeProperty):
+    """A property for an integer attribute that only holds 0 or 1."""
+
+    def __init__(self, attr_name, doc=None):
+        IntAttributeProperty.__init__(self, attr_name, 0, 1, doc)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        return bool(obj._get_attribute(self._attr_name))
+
+    def __set__(self, obj, value):
+        IntAttributeProperty.__set__(self, obj, int(value))
+
+
+class YesNoAttributeProperty(AttributeProperty):
+    """A property for a Yes/No enum attribute."""
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        return bool(obj._get_attribute(self._attr_name))
+
+    def __set__(self, obj, value):
+        obj._set_yes_no_attribute(self._attr_name, value)
@@ -20,21 +20,42 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
+
+# Choices of the Yes/No enum definitions. Definitions created from it get
+# their own copy.
+YES_NO_CHOICES = {0: 'No', 1: 'Yes'}
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+
+    return value
+
 
 class AttributeDefinition(object):
     """A definition of an attribute that can be associated with attributes in nodes/messages/signals."""
 
+    __slots__ = (
+        '_name', '_default_value', '_kind', '_type_name',
+        '_minimum', '_maximum', '_choices', '_choice_values'
+    )
+
     def __init__(
         self, name, default_value=None, kind=None, type_name=None,
         minimum=None, maximum=None, choices=None
     ):
-        self._name = name
+        # names are used as dictionary keys on every attribute access,
+        # interning them lets the lookups succeed on the identity check
+        self._name = _intern(name)
         self._default_value = default_value
-        self._kind = kind
-        self._type_name = type_name
+        self._kind = _intern(kind)
+        self._type_name = _intern(type_name)
         self._minimum = minimum
         self._maximum = maximum
         self._choices = choices
+        self._choice_values = None
 
     @property
     def name(self):
@@ -86,3 +107,29 @@ class AttributeDefinition(object):
     @choices.setter
     def choices(self, value):
         self._choices = value
+        self._choice_values = None
+
+    def _choice_value(self, value):
+        # enum attributes store the index of the choice. the reversed
+        # mapping is built on first use, indexes are passed through as is
+        if isinstance(value, int):
+            return value
+
+        # the choices can be changed in place, a cached index that no
+        # longer points at the value gets the mapping rebuilt
+        if self._choice_values is not None:
+            index = self._choice_values.get(value)
+
+            try:
+                if index is not None and self._choices[index] == value:
+                    return index
+            except (KeyError, IndexError):
+                pass
+
+        if isinstance(self._choices, dict):
+            items = self._choices.items()
+        else:
+            items = enumerate(self._choices)
+
+        self._choice_values = {v: k for k, v in items}
+        return self._choice_values[value]
@@ -25,11 +25,14 @@ from .comment import Comment
 class Bus(object):
     """A CAN bus."""
 
+    __slots__ = ('_name', '_comment', '_baudrate', '_parent')
+
     def __init__(self, name, comment=None, baudrate=None):
         self._name = name
-        self._comment = comment
+        self._comment = None
         self._baudrate = baudrate
         self._parent = None
+        self.comment = comment
 
     @property
     def parent(self):
@@ -43,15 +46,12 @@ class Bus(object):
     @property
     def comment(self):
         """The bus comment, or ``None`` if unavailable."""
-        if self._comment is not None and not isinstance(self._comment, Comment):
-            self._comment = Comment(self._comment)
-
         return self._comment
 
     @comment.setter
     def comment(self, value):
-        if value is not None and not isinstance(value, (str, Comment)):
-            value = str(value)
+        if value is not None and not isinstance(value, Comment):
+            value = Comment(value)
 
         self._comment = value
 
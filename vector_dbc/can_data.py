@@ -20,44 +20,84 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from .frame_id import (
-    J1939FrameId,
-    GMParameterIdExtended,
-)
+from .frame_id import SOURCE_ATTRIBUTES
 
 
 class TXData(bytearray):
-    _frame_id = None
+    __slots__ = ('_frame_id', '_frame_id_int', '_frame_id_hex')
+
+    _source_attributes = SOURCE_ATTRIBUTES
+
+    def __init__(self, *args, **kwargs):
+        bytearray.__init__(self, *args, **kwargs)
+        self._frame_id = None
+        self._frame_id_int = None
+        self._frame_id_hex = None
 
     @property
     def hex(self):
-        return ' '.join(hex(item)[2:].upper().zfill(2) for item in self)
+        try:
+            return bytearray.hex(self, ' ').upper()
+        except TypeError:
+            # Python < 3.8 has no separator argument
+            return ' '.join('%02X' % item for item in self)
 
     @property
     def frame_id_hex(self):
-        return self._frame_id.hex
+        if self._frame_id_hex is None:
+            self._frame_id_hex = self._frame_id.hex
+
+        return self._frame_id_hex
 
     @property
     def frame_id(self):
-        return int(self._frame_id)
+        if self._frame_id_int is None:
+            self._frame_id_int = int(self._frame_id)
+
+        return self._frame_id_int
 
     @frame_id.setter
     def frame_id(self, value):
         self._frame_id = value
+        self._frame_id_int = None
+        self._frame_id_hex = None
 
     def set_sending_node(self, node):
         tp_tx_indentfier = node.tp_tx_indentfier
 
-        if tp_tx_indentfier is not None:
-            if isinstance(self._frame_id, J1939FrameId):
-                self._frame_id.source_address = tp_tx_indentfier
+        if tp_tx_indentfier is None:
+            return
+
+        attr_name = self._source_attributes.get(type(self._frame_id))
+
+        if attr_name is not None:
+            # the frame id object belongs to the message, changing it in
+            # place would change the id of the message itself
+            self._frame_id = self._frame_id.copy()
+            setattr(self._frame_id, attr_name, tp_tx_indentfier)
+            self._frame_id_int = None
+            self._frame_id_hex = None
+
+
+class RXData(dict):
+    """
+    Decoded signals keyed by signal name.
+
+    Iterating, indexing with an integer and ``+=`` behave like they did
+    when this was a list of signals. Signal names are unique, assigning
+    a signal by index that has the name of another entry raises
+    ``ValueError``.
+    """
 
-            elif isinstance(self._frame_id, GMParameterIdExtended):
-                self._frame_id.source_id = tp_tx_indentfier
+    __slots__ = ('_frame_id',)
 
+    def __init__(self, signals=()):
+        dict.__init__(self)
+        self._frame_id = None
+        self.extend(signals)
 
-class RXData(list):
-    _frame_id = None
+    def __reduce__(self):
+        return self.__class__, (list(self.values()),), (None, {'_frame_id': self._frame_id})
 
     @property
     def frame_id(self):
@@ -67,37 +107,74 @@ class RXData(list):
     def frame_id(self, value):
         self._frame_id = value
 
-    def __getitem__(self, item):
-        if isinstance(item, int):
-            return list.__getitem__(self, item)
+    def append(self, signal):
+        dict.__setitem__(self, signal.name, signal)
+
+    def extend(self, signals):
+        for signal in signals:
+            dict.__setitem__(self, signal.name, signal)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
 
-        for signal in self:
-            if signal.name == item:
-                return signal
+    def __iter__(self):
+        return iter(self.values())
 
-        raise KeyError('"{0}" cannot be found.'.format(item))
+    def __reversed__(self):
+        return reversed(self.values())
+
+    def __getitem__(self, item):
+        # exact type test first, names are almost always plain strings
+        if type(item) is not str:
+            if isinstance(item, bytes):
+                item = item.decode('utf-8')
+            elif not isinstance(item, str):
+                return list(self.values())[item]
+
+        try:
+            return dict.__getitem__(self, item)
+        except KeyError:
+            raise KeyError('"{0}" cannot be found.'.format(item))
 
     def __setitem__(self, key, value):
-        if isinstance(key, int):
-            list.__setitem__(self, key, value)
+        if isinstance(key, bytes):
+            key = key.decode('utf-8')
+
+        if isinstance(key, str):
+            dict.__setitem__(self, key, value)
             return
 
-        for i, signal in enumerate(self):
-            if signal.name == key:
-                self[i] = value
-                return
+        signals = list(self.values())
+        signals[key] = value
 
-        self.append(value)
+        # the signals are keyed by name, a second signal with the same
+        # name would replace the first one and the length would change
+        names = set(signal.name for signal in signals)
+        if len(names) != len(signals):
+            raise ValueError('Signal names must be unique.')
 
-    def __contains__(self, item):
-        if isinstance(item, bytes):
-            item = item.decode('utf-8')
+        self.clear()
+        self.extend(signals)
+
+    def __delitem__(self, key):
+        if isinstance(key, bytes):
+            key = key.decode('utf-8')
 
-        if isinstance(item, str):
-            for signal in self:
-                if signal.name == item:
-                    return True
+        if isinstance(key, str):
+            dict.__delitem__(self, key)
+            return
 
-            return False
+        signals = list(self.values())
+        del signals[key]
+        self.clear()
+        self.extend(signals)
+
+    def __contains__(self, item):
+        if type(item) is not str:
+            if isinstance(item, bytes):
+                item = item.decode('utf-8')
+            elif not isinstance(item, str):
+                return self.get(getattr(item, 'name', None)) is item
 
-        return list.__contains__(self, item)
+        return dict.__contains__(self, item)
@@ -1,14 +1,25 @@
 
 
 class Comment(str):
-    _fmt = 'CM_ "{comment}" ;'
+    _fmt = 'CM_ "%s" ;'
+    _escaped = None
+
+    def _escape(self):
+        # the string is immutable so the escaped copy only needs to be made once
+        if self._escaped is None:
+            if '"' in self:
+                self._escaped = self.replace('"', '\\"')
+            else:
+                self._escaped = str(self)
+
+        return self._escaped
 
     def format(self, *args, **kwargs):
-        return self._fmt.format(comment=self.replace('"', '\\"'))
+        return self._fmt % (self._escape(),)
 
 
 class NodeComment(Comment):
-    _fmt = 'CM_ BU_ {name} "{comment}" ;'
+    _fmt = 'CM_ BU_ %s "%s" ;'
 
     def __init__(self, value):
         self._node = None
@@ -19,10 +30,7 @@ class NodeComment(Comment):
             super(NodeComment, self).__init__()
 
     def format(self, *args, **kwargs):
-        return self._fmt.format(
-            name=self._node.name,
-            comment=self.replace('"', '\\"')
-        )
+        return self._fmt % (self._node.name, self._escape())
 
     @property
     def node(self):
@@ -34,7 +42,7 @@ class NodeComment(Comment):
 
 
 class MessageComment(Comment):
-    _fmt = 'CM_ BO_ {frame_id} "{comment}" ;'
+    _fmt = 'CM_ BO_ %d "%s" ;'
 
     def __init__(self, value):
         self._message = None
@@ -45,10 +53,7 @@ class MessageComment(Comment):
             super(MessageComment, self).__init__()
 
     def format(self, *args, **kwargs):
-        return self._fmt.format(
-            frame_id=self._message.dbc_frame_id,
-            comment=self.replace('"', '\\"')
-        )
+        return self._fmt % (self._message.dbc_frame_id, self._escape())
 
     @property
     def message(self):
@@ -60,7 +65,7 @@ class MessageComment(Comment):
 
 
 class SignalComment(Comment):
-    _fmt = 'CM_ SG_ {frame_id} {name} "{comment}";'
+    _fmt = 'CM_ SG_ %d %s "%s";'
 
     def __init__(self, value):
         self._signal = None
@@ -71,10 +76,10 @@ class SignalComment(Comment):
             super(SignalComment, self).__init__()
 
     def format(self, *args, **kwargs):
-        return self._fmt.format(
-            frame_id=self._signal.message.dbc_frame_id,
-            name=self._signal.name,
-            comment=self.replace('"', '\\"')
+        return self._fmt % (
+            self._signal.message.dbc_frame_id,
+            self._signal.name,
+            self._escape()
         )
 
     @property
@@ -87,7 +92,7 @@ class SignalComment(Comment):
 
 
 class EnvironmentVariableComment(Comment):
-    _fmt = 'CM_ EV_ {name} "{comment}";'
+    _fmt = 'CM_ EV_ %s "%s";'
 
     def __init__(self, value):
         self._environment_variable = None
@@ -98,10 +103,7 @@ class EnvironmentVariableComment(Comment):
             super(EnvironmentVariableComment, self).__init__()
 
     def format(self, *args, **kwargs):
-        return self._fmt.format(
-            name=self._environment_variable.name,
-            comment=self.replace('"', '\\"')
-        )
+        return self._fmt % (self._environment_variable.name, self._escape())
 
     @property
     def environment_variable(self):
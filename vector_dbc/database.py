@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import codecs
 import logging
 
 from . import dbc
@@ -41,6 +42,26 @@ FRAME_IDS = (
 
 LOGGER = logging.getLogger(__name__)
 
+# DBC files are written by CANdb++ which uses the Windows code page
+_CP1252 = codecs.lookup('cp1252')
+
+
+def _decode_dbc(data, encoding):
+    # bytes are decoded with `encoding`, the newlines end up the same as
+    # when reading a file opened in text mode
+    if isinstance(data, (bytes, bytearray)):
+        if encoding == 'cp1252':
+            codec = _CP1252
+        else:
+            codec = codecs.lookup(encoding)
+
+        data = codec.decode(data)[0]
+
+    if '\r' in data:
+        data = data.replace('\r\n', '\n').replace('\r', '\n')
+
+    return data
+
 
 class Database(attribute.AttributeMixin):
     _marker = ''
@@ -66,6 +87,12 @@ class Database(attribute.AttributeMixin):
         self._buses = buses if buses else []
         self._name_to_message = {}
         self._frame_id_to_message = {}
+        self._dispatch = {}
+        self._name_to_node = {}
+        self._tp_id_to_node = {}
+        self._name_to_bus = {}
+        self._ecu_to_nodes = {}
+        self._node_signals = None
         self._version = version
         self._dbc = dbc_specifics
 
@@ -89,17 +116,21 @@ class Database(attribute.AttributeMixin):
 
     @messages.setter
     def messages(self, value):
+        # keyed by id so replaced messages can be dropped without
+        # searching the list for each one
+        messages = {id(message): message for message in self._messages}
+
         for message in value:
             res = self._add_message(message)
-            if res is True:
-                self._messages += [message]
-            else:
-                self._messages.remove(res)
-                self._messages += [message]
+            if res is not True:
+                messages.pop(id(res), None)
 
-            message._parent = self
+            messages[id(message)] = message
             message.refresh(self._strict)
 
+        self._messages[:] = messages.values()
+        self._refresh(False)
+
     @property
     def nodes(self):
         """A list of nodes in the database."""
@@ -107,7 +138,7 @@ class Database(attribute.AttributeMixin):
 
     @nodes.setter
     def nodes(self, value):
-        node_names = {node.name: node for node in self._nodes}
+        node_names = {node.name: index for index, node in enumerate(self._nodes)}
 
         for node in value:
             if node.name in node_names:
@@ -116,11 +147,12 @@ class Database(attribute.AttributeMixin):
                     node.name
                 )
 
-                index = self._nodes.index(node_names[node.name])
-                self._nodes[index] = node
+                self._nodes[node_names[node.name]] = node
             else:
                 self._nodes += [node]
 
+        self._refresh_nodes()
+
     @property
     def buses(self):
         """A list of CAN buses in the database."""
@@ -147,11 +179,7 @@ class Database(attribute.AttributeMixin):
     @classmethod
     def load(cls, path):
         instance = cls()
-
-        # noinspection PyArgumentEqualDefault
-        with open(path, 'r', encoding='cp1252') as f:
-            instance.add_string(f.read())
-
+        instance.add_file(path)
         return instance
 
     def add_file(self, filename, encoding='cp1252'):
@@ -161,20 +189,45 @@ class Database(attribute.AttributeMixin):
 
         `encoding` specifies the file encoding.
         """
-        # noinspection PyArgumentEqualDefault
-        with open(filename, 'r', encoding=encoding) as fin:
-            self.add_string(fin.read())
+        with open(filename, 'rb') as fin:
+            self.add_string(_decode_dbc(fin.read(), encoding))
+
+    def add_stream(self, stream, encoding='cp1252'):
+        """
+        Read and parse DBC data from the file like object `stream` and add
+        the parsed data to the database.
+
+        `stream` can be opened in text or binary mode, binary data is
+        decoded using `encoding`. The whole stream is read before parsing,
+        same as :meth:`add_file`.
+        """
+        self.add_string(_decode_dbc(stream.read(), encoding))
 
     def add_string(self, string):
         """Parse given DBC data string and add the parsed data to the database."""
         database = dbc.load_string(self, string, self._strict)
 
         self._messages += database.messages
-        self._nodes = database.nodes
-        self._buses = database.buses
         self._version = database.version
         self._dbc = database.dbc
-        self.refresh()
+
+        # the loader refreshes every message it creates and the messages
+        # that were already here are indexed, only the new ones get added
+        self._index_messages(database.messages, False)
+
+        # merged by name the same way the nodes setter does it so nodes and
+        # buses that are already in the database are kept
+        self.nodes = database.nodes
+
+        bus_names = {bus.name: index for index, bus in enumerate(self._buses)}
+
+        for bus in database.buses:
+            if bus.name in bus_names:
+                self._buses[bus_names[bus.name]] = bus
+            else:
+                self._buses += [bus]
+
+        self._refresh_buses()
 
     def _add_message(self, message):
         """Add given message to the database."""
@@ -217,18 +270,27 @@ class Database(attribute.AttributeMixin):
             if isinstance(frame_id_or_name, bytes):
                 frame_id_or_name = frame_id_or_name.decode('utf-8')
 
-            if frame_id_or_name in self._name_to_message:
-                res = [self._name_to_message[frame_id_or_name]]
-            else:
-                res = []
-        else:
-            res = [
-                message for message in self.messages
-                if message.frame_id == frame_id_or_name
-            ]
+            # a miss raises KeyError(frame_id_or_name)
+            return self._name_to_message[frame_id_or_name]
 
-        if len(res) > 0:
-            return res[0]
+        try:
+            message = self._frame_id_to_message[
+                frame_id_or_name & self._frame_id_mask
+            ]
+        except (KeyError, TypeError):
+            pass
+        else:
+            # the index is keyed by the masked id and is only rebuilt on
+            # refresh, a hit still has to be the exact frame id
+            if message.frame_id == frame_id_or_name:
+                return message
+
+        # frame id types like the GM parameter ids compare equal to more
+        # than a single integer value so anything not in the index still
+        # gets checked the long way.
+        for message in self._messages:
+            if message.frame_id == frame_id_or_name:
+                return message
 
         raise KeyError(frame_id_or_name)
 
@@ -236,28 +298,45 @@ class Database(attribute.AttributeMixin):
         """Find the node object for given name `name`."""
 
         if isinstance(name_or_id, int):
-            res = [
-                node for node in self._nodes
-                if name_or_id in (node.tp_rx_indentfier, node.tp_tx_indentfier)
-            ]
+            node = self._tp_id_to_node.get(name_or_id, None)
+
+            # the identifiers can change after the index was built
+            if node is not None and (
+                node.tp_rx_indentfier == name_or_id or
+                node.tp_tx_indentfier == name_or_id
+            ):
+                return node
+
+            # nodes added to the list directly are not in the index
+            for node in self._nodes:
+                if (
+                    node.tp_rx_indentfier == name_or_id or
+                    node.tp_tx_indentfier == name_or_id
+                ):
+                    return node
 
         else:
-            res = [
-                node for node in self._nodes
-                if node.name == name_or_id
-            ]
+            node = self._name_to_node.get(name_or_id, None)
+            if node is not None:
+                return node
 
-        if len(res) > 0:
-            return res[0]
+            for node in self._nodes:
+                if node.name == name_or_id:
+                    return node
 
         raise KeyError(name_or_id)
 
     def get_bus(self, name):
         """Find the bus object for given name `name`."""
 
-        bus = [bus for bus in self._buses if bus.name == name]
-        if len(bus) > 0:
-            return bus[0]
+        bus = self._name_to_bus.get(name, None)
+
+        if bus is not None and bus.name == name:
+            return bus
+
+        for bus in self._buses:
+            if bus.name == name:
+                return bus
 
         raise KeyError(name)
 
@@ -277,7 +356,7 @@ class Database(attribute.AttributeMixin):
         If `strict` is ``True`` all signal values must be within their
         allowed ranges, or an exception is raised.
         """
-        message = self.get_message(frame_id_or_name)
+        message = self._dispatch_message(frame_id_or_name)
         return message.encode(data, scaling, padding, strict)
 
     def decode_message(
@@ -294,9 +373,42 @@ class Database(attribute.AttributeMixin):
 
         If `scaling` is ``False`` no scaling of signals is performed.
         """
-        message = self.get_message(frame_id_or_name)
+        message = self._dispatch_message(frame_id_or_name)
         return message.decode(data, decode_choices, scaling)
 
+    def decode_frames(self, frames, decode_choices=True, scaling=True):
+        """
+        Decode an iterable of ``(frame_id_or_name, data)`` pairs. Returns a
+        list holding the decoded data of each frame.
+
+        `decode_choices` and `scaling` are passed on like they are in
+        :meth:`.decode_message()`.
+        """
+        dispatch_message = self._dispatch_message
+        res = []
+
+        for frame_id_or_name, data in frames:
+            message = dispatch_message(frame_id_or_name)
+            res.append(message.decode(data, decode_choices, scaling))
+
+        return res
+
+    def _dispatch_message(self, frame_id_or_name):
+        try:
+            message = self._dispatch[frame_id_or_name]
+        except (KeyError, TypeError):
+            pass
+        else:
+            # the table is only rebuilt on refresh, the name or frame id
+            # of the message may have changed since then
+            if (
+                message._name == frame_id_or_name or
+                message.frame_id == frame_id_or_name
+            ):
+                return message
+
+        return self.get_message(frame_id_or_name)
+
     def refresh(self):
         """
         Refresh the internal database state.
@@ -305,179 +417,223 @@ class Database(attribute.AttributeMixin):
         database to refresh the internal lookup tables used when
         encoding and decoding messages.
         """
+        self._refresh(True)
+
+    def _refresh(self, refresh_messages):
+        # `refresh_messages` is False when every message is known to be
+        # up to date already, only the lookup tables get rebuilt then.
         self._name_to_message = {}
         self._frame_id_to_message = {}
+        self._dispatch = {}
 
-        for message in self._messages:
+        self._index_messages(self._messages, refresh_messages)
+        self._refresh_nodes()
+        self._refresh_buses()
+
+    def _index_messages(self, messages, refresh_messages):
+        mask = self._frame_id_mask
+        strict = self._strict
+        name_to_message = self._name_to_message
+        frame_id_to_message = self._frame_id_to_message
+
+        # messages keyed by both name and exact frame id so
+        # encode_message and decode_message are a single dict lookup
+        dispatch = self._dispatch
+        self._node_signals = None
+
+        for message in messages:
             message._parent = self
-            message.refresh(self._strict)
-            self._add_message(message)
 
-        for node in self._nodes:
-            node._parent = self
+            if refresh_messages:
+                message.refresh(strict)
+
+            name = message.name
+            masked_frame_id = message.frame_id.frame_id & mask
+
+            existing = name_to_message.setdefault(name, message)
+            if existing is not message:
+                LOGGER.warning(
+                    "Overwriting message '%s' with '%s' in the "
+                    "name to message dictionary.",
+                    existing.name,
+                    name)
+
+                name_to_message[name] = message
+
+            existing = frame_id_to_message.setdefault(masked_frame_id, message)
+            if existing is not message:
+                LOGGER.warning(
+                    "Overwriting message '%s' with '%s' in the frame id to message "
+                    "dictionary because they have identical masked frame ids 0x%x.",
+                    existing.name,
+                    name,
+                    masked_frame_id)
+
+                frame_id_to_message[masked_frame_id] = message
+
+            dispatch[name] = dispatch[message.frame_id.frame_id] = message
+
+    def _refresh_buses(self):
+        name_to_bus = {}
 
         for bus in self._buses:
             bus._parent = self
+            name_to_bus.setdefault(bus.name, bus)
 
-    @property
-    def nm_base_address(self):
-        """
-        Defines the CAN ID of the first network management message.
-        """
-        return self._get_attribute('NmBaseAddress')
+        self._name_to_bus = name_to_bus
 
-    @nm_base_address.setter
-    def nm_base_address(self, value):
-        self._set_hex_attribute('NmBaseAddress', 0x0, 0x7FF, value)
+    def _get_node_signals(self):
+        # node name -> (tx signals, rx signals), built on first use and
+        # dropped whenever the messages or nodes are indexed again
+        if self._node_signals is None:
+            node_signals = {}
 
-    @property
-    def tp_base_address(self):
+            for message in self._messages:
+                signals = message._signals
+
+                for name in message._sender_names:
+                    node_signals.setdefault(name, ([], []))[0].extend(signals)
+
+                for name in message._receiver_names:
+                    node_signals.setdefault(name, ([], []))[1].extend(signals)
+
+            self._node_signals = dict(
+                (name, (tuple(tx), tuple(rx)))
+                for name, (tx, rx) in node_signals.items()
+            )
+
+        return self._node_signals
+
+    def _refresh_nodes(self):
+        self._node_signals = None
+        name_to_node = {}
+        tp_id_to_node = {}
+        ecu_to_nodes = {}
+
+        for node in self._nodes:
+            node._parent = self
+            # attributes may have been changed through node.dbc directly
+            node._tp_tx_cache = None
+            name_to_node.setdefault(node.name, node)
+
+            if node.dbc is None:
+                continue
+
+            for tp_id in (node.tp_rx_indentfier, node.tp_tx_indentfier):
+                if tp_id is not None:
+                    tp_id_to_node.setdefault(tp_id, node)
+
+            ecu_name = node._get_attribute('ECU')
+            if ecu_name is not None:
+                ecu_to_nodes.setdefault(ecu_name, []).append(node)
+
+        self._name_to_node = name_to_node
+        self._tp_id_to_node = tp_id_to_node
+        self._ecu_to_nodes = ecu_to_nodes
+
+    nm_base_address = attribute.HexAttributeProperty(
+        'NmBaseAddress', 0x0, 0x7FF,
+        doc="""
+        Defines the CAN ID of the first network management message.
         """
+    )
+
+    tp_base_address = attribute.HexAttributeProperty(
+        'TpBaseAddress', 0x0, 0x7FF,
+        doc="""
         The base address that is used to determine the CAN ID for the TP messages (extended addressing mode only).
         """
-        return self._get_attribute('TpBaseAddress')
+    )
 
-    @tp_base_address.setter
-    def tp_base_address(self, value):
-        self._set_hex_attribute('TpBaseAddress', 0x0, 0x7FF, value)
-
-    @property
-    def use_gm_parameter_ids(self):
-        """
+    use_gm_parameter_ids = attribute.BoolAttributeProperty(
+        'UseGMParameterIDs',
+        doc="""
         GM parameter ids derived from the frame id.
         """
-        return bool(self._get_attribute('UseGMParameterIDs'))
-
-    @use_gm_parameter_ids.setter
-    def use_gm_parameter_ids(self, value):
-        self._set_int_attribute('UseGMParameterIDs', 0, 1, int(value))
+    )
 
-    @property
-    def gen_nwm_sleep_time(self):
-        """
+    gen_nwm_sleep_time = attribute.IntAttributeProperty(
+        'GenNWMSleepTime', 0, 2147483647,
+        doc="""
         If all nodes have the same wait time up to SleepRequest, set this time in this attribute in ms.
         """
-        return self._get_attribute('GenNWMSleepTime')
+    )
 
-    @gen_nwm_sleep_time.setter
-    def gen_nwm_sleep_time(self, value):
-        self._set_int_attribute('GenNWMSleepTime', 0, 2147483647, value)
-
-    @property
-    def nm_message_count(self):
-        """
+    nm_message_count = attribute.IntAttributeProperty(
+        'NmMessageCount', 1, 255,
+        doc="""
         Defines the number of CAN IDs used or reserved for network management messages.
 
         This is then the maximum number of network management message on the network.
         """
-        return self._get_attribute('NmMessageCount')
-
-    @nm_message_count.setter
-    def nm_message_count(self, value):
-        self._set_int_attribute('NmMessageCount', 1, 255, value)
+    )
 
-    @property
-    def version_year(self):
-        """
+    version_year = attribute.IntAttributeProperty(
+        'VersionYear', 0, 99,
+        doc="""
         Specifies the year of the network release.
         """
-        return self._get_attribute('VersionYear')
+    )
 
-    @version_year.setter
-    def version_year(self, value):
-        self._set_int_attribute('VersionYear', 0, 99, value)
-
-    @property
-    def version_month(self):
-        """
+    version_month = attribute.IntAttributeProperty(
+        'VersionMonth', 1, 12,
+        doc="""
         Specifies the month of the network release.
         """
-        return self._get_attribute('VersionMonth')
-
-    @version_month.setter
-    def version_month(self, value):
-        self._set_int_attribute('VersionMonth', 1, 12, value)
+    )
 
-    @property
-    def version_week(self):
-        """
+    version_week = attribute.IntAttributeProperty(
+        'VersionWeek', 0, 52,
+        doc="""
         Specifies the week of the network release.
         """
-        return self._get_attribute('VersionWeek')
+    )
 
-    @version_week.setter
-    def version_week(self, value):
-        self._set_int_attribute('VersionWeek', 0, 52, value)
-
-    @property
-    def version_day(self):
-        """
+    version_day = attribute.IntAttributeProperty(
+        'VersionDay', 1, 31,
+        doc="""
         Specifies the day of the network release.
         """
-        return self._get_attribute('VersionDay')
-
-    @version_day.setter
-    def version_day(self, value):
-        self._set_int_attribute('VersionDay', 1, 31, value)
+    )
 
-    @property
-    def version_number(self):
-        """
+    version_number = attribute.IntAttributeProperty(
+        'VersionNumber', 0, 2147483647,
+        doc="""
         Specifies the version number of the network release. The numbers have to be given in BCD coding.
         """
-        return self._get_attribute('VersionNumber')
+    )
 
-    @version_number.setter
-    def version_number(self, value):
-        self._set_int_attribute('VersionNumber', 0, 2147483647, value)
-
-    @property
-    def nm_type(self):
-        """
+    nm_type = attribute.AttributeProperty(
+        'NmType',
+        doc="""
         Defines the type of network management used on the network e.g. Vector.
         """
-        return self._get_attribute('NmType')
-
-    @nm_type.setter
-    def nm_type(self, value):
-        self._set_str_attribute('NmType', value)
+    )
 
-    @property
-    def manufacturer(self):
-        """
+    manufacturer = attribute.AttributeProperty(
+        'Manufacturer',
+        doc="""
         Specifies the OEM.
         """
-        return self._get_attribute('Manufacturer')
+    )
 
-    @manufacturer.setter
-    def manufacturer(self, value):
-        self._set_str_attribute('Manufacturer', value)
-
-    @property
-    def db_name(self):
-        """
+    db_name = attribute.AttributeProperty(
+        'DBName',
+        doc="""
         Specifies the OEM.
         """
-        return self._get_attribute('DBName')
-
-    @db_name.setter
-    def db_name(self, value):
-        self._set_str_attribute('DBName', value)
+    )
 
-    @property
-    def bus_type(self):
-        """
+    bus_type = attribute.AttributeProperty(
+        'BusType',
+        doc="""
         Defines the type of the network, e.g. "CAN", "LIN", "MOST", "Ethernet", "ARINC425", "AFDX"
         """
-        return self._get_attribute('BusType')
+    )
 
-    @bus_type.setter
-    def bus_type(self, value):
-        self._set_str_attribute('BusType', value)
-
-    @property
-    def protocol_type(self):
-        """
+    protocol_type = attribute.AttributeProperty(
+        'ProtocolType',
+        doc="""
         This attribute defines the protocol type.
 
         Several functions are activated in CANoe/CANalyzer by this attribute.
@@ -486,15 +642,11 @@ class Database(attribute.AttributeMixin):
         J1939, CANopen, AFDX, ARINC825, CANaerospace, CANopenSafety, Aerospace, NMEA2000
 
         """
-        return self._get_attribute('ProtocolType')
-
-    @protocol_type.setter
-    def protocol_type(self, value):
-        self._set_str_attribute('ProtocolType', value)
+    )
 
-    @property
-    def is_multiplex_ext_enabled(self):
-        """
+    is_multiplex_ext_enabled = attribute.YesNoAttributeProperty(
+        'MultiplexExtEnabled',
+        doc="""
         The extended multiplexor concept allows you to define several multiplexor signals in
         a single message. One multiplexed signal may be multiplexed through several multiplex
         values. If you want to use extended multiplexing, you must activate the option Enable
@@ -504,9 +656,5 @@ class Database(attribute.AttributeMixin):
         MultiplexExtEnabled attribute to Yes for the network.
 
         """
-        return bool(self._get_attribute('MultiplexExtEnabled'))
-
-    @is_multiplex_ext_enabled.setter
-    def is_multiplex_ext_enabled(self, value):
-        self._set_yes_no_attribute('MultiplexExtEnabled', value)
+    )
 
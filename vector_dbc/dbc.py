@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 import re
+import sys
 from collections import OrderedDict as odict
 from collections import defaultdict
 from decimal import Decimal
@@ -560,7 +561,7 @@ def _dump_comments(database):
     cm += [
         signal.comment.format()
         for message in database.messages
-        for signal in message.signals[::-1]
+        for signal in message._signals[::-1]
         if signal.comment is not None
     ]
 
@@ -571,7 +572,7 @@ def _dump_signal_types(database):
     valtype = []
 
     for message in database.messages:
-        for signal in message.signals:
+        for signal in message._signals:
             if not signal.is_float:
                 continue
 
@@ -724,7 +725,7 @@ def _dump_attributes(database):
                 signal_name=signal.name,
                 value=get_value(attribute)
             )
-            for signal in message.signals[::-1]
+            for signal in message._signals[::-1]
             for attribute in signal.dbc.attributes.values()
             if signal.dbc is not None
             and signal.dbc.attributes is not None
@@ -745,7 +746,7 @@ def _dump_choices(database):
             )
         )
         for message in database.messages
-        for signal in message.signals[::-1]
+        for signal in message._signals[::-1]
         if signal.choices is not None
     ]
 
@@ -756,8 +757,8 @@ def _dump_signal_groups(database):
     sig_group = [
         str(signal_group)
         for message in database.messages
-        for signal_group in message.signal_groups
-        if message.signal_groups is not None
+        for signal_group in message._signal_groups
+        if message._signal_groups is not None
     ]
     return sig_group
 
@@ -767,14 +768,14 @@ def _is_extended_mux_needed(messages):
     for message in messages:
         multiplexers = [
             signal.name
-            for signal in message.signals
+            for signal in message._signals
             if signal.is_multiplexer
         ]
 
         if len(multiplexers) > 1:
             return True
 
-        for signal in message.signals:
+        for signal in message._signals:
             if signal.multiplexer_ids:
                 if len(signal.multiplexer_ids) > 1:
                     return True
@@ -812,10 +813,10 @@ def _dump_signal_mux_values(database):
         return []
 
     sig_mux_values = [
-        str(signal.multiplexer)
+        str(signal._multiplexer)
         for message in database.messages
-        for signal in message.signals
-        if signal.multiplexer
+        for signal in message._signals
+        if signal._multiplexer
     ]
 
     return sig_mux_values
@@ -882,7 +883,7 @@ def _load_attributes(tokens, definitions):
         return Attribute(value=value, definition=definition)
 
     for attribute in tokens.get('BA_', []):
-        name = attribute[1]
+        name = sys.intern(attribute[1])
 
         if len(attribute[2]) > 0:
             item = attribute[2][0]
@@ -1497,7 +1498,7 @@ def make_node_names_unique(database):
                 if sender == node.name:
                     message.senders[index] = name
 
-            for signal in message.signals:
+            for signal in message._signals:
                 for index, receiver in enumerate(signal.receivers):
                     if receiver == node.name:
                         signal.receivers[index] = name
@@ -1536,7 +1537,7 @@ def make_signal_names_unique(database):
     converter = LongNamesConverter(database)
 
     for message in database.messages:
-        for signal in message.signals:
+        for signal in message._signals:
             name = converter.convert(signal.name)
             try_remove_attribute(signal.dbc, 'SystemSignalLongSymbol')
 
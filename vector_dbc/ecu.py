@@ -35,16 +35,16 @@ class ECU(object):
     To define an ecm you use the `ecm` property in a `Node` instance.
     """
 
+    __slots__ = ('_database', '_name', '_name_bytes')
+
     def __init__(self, database, name):
         self._database = database
         self._name = name
+        self._name_bytes = None
 
     @property
     def nodes(self):
-        return [
-            node for node in self._database.nodes
-            if node.ecu is not None and node.ecu == self.name
-        ]
+        return list(self._database._ecu_to_nodes.get(self._name, []))
 
     @property
     def database(self):
@@ -58,6 +58,7 @@ class ECU(object):
     def name(self, value):
         nodes = self.nodes
         self._name = value
+        self._name_bytes = None
 
         for node in nodes:
             node.ecu = self
@@ -66,15 +67,22 @@ class ECU(object):
         return self._name
 
     def __eq__(self, other):
+        # plain strings are what nodes store so they get checked first
+        if type(other) is str:
+            return other == self._name
+
+        if isinstance(other, ECU):
+            return other._name == self._name
+
         if isinstance(other, bytes):
-            other = other.decode('utf-8')
+            if self._name_bytes is None:
+                self._name_bytes = self._name.encode('utf-8')
+
+            return other == self._name_bytes
 
         if isinstance(other, str):
             return other == self._name
 
-        if isinstance(other, ECU):
-            return other.name == self._name
-
         return False
 
     def __ne__(self, other):
@@ -21,15 +21,30 @@
 # SOFTWARE.
 
 from . import attribute
-from . import attribute_definition
 from .comment import EnvironmentVariableComment
 
+# shared by every GenEnvControlType definition created by this module
+GEN_ENV_CONTROL_TYPE_CHOICES = {
+    0: 'NoControl',
+    1: 'SliderHoriz',
+    2: 'SliderVert',
+    3: 'PushButton',
+    4: 'Edit',
+    5: 'BitmapSwitch'
+}
+
 
 class EnvironmentVariable(attribute.AttributeMixin):
     """A CAN environment variable."""
 
     _marker = 'EV_'
 
+    __slots__ = (
+        '_name', '_env_type', '_minimum', '_maximum', '_unit',
+        '_initial_value', '_env_id', '_access_type', '_access_node',
+        '_comment'
+    )
+
     def __init__(
         self, name, env_type, minimum, maximum, unit, initial_value,
         env_id, access_type, access_node, comment
@@ -147,101 +162,26 @@ class EnvironmentVariable(attribute.AttributeMixin):
 
         self._comment = value
 
-    @property
-    def gen_env_auto_gen_ctrl(self):
-        return bool(self._get_attribute('GenEnvAutoGenCtrl'))
-
-    @gen_env_auto_gen_ctrl.setter
-    def gen_env_auto_gen_ctrl(self, value):
-        self._set_yes_no_attribute('GenEnvAutoGenCtrl', value)
+    gen_env_auto_gen_ctrl = attribute.YesNoAttributeProperty('GenEnvAutoGenCtrl')
 
     @property
     def gen_env_control_type(self):
-        if 'GenEnvControlType' in self.dbc.attributes:
-            value = self.dbc.attributes['GenEnvControlType'].value
-            return self.dbc.attributes['GenEnvControlType'].definition.choices[value]
+        return self._get_enum_attribute('GenEnvControlType')
 
     @gen_env_control_type.setter
     def gen_env_control_type(self, value):
-        if 'GenEnvControlType' in self.dbc.attributes:
-            self.dbc.attributes['GenEnvControlType'].value = value
-        else:
-
-            if 'GenEnvControlType' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['GenEnvControlType']
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    'GenEnvControlType',
-                    default_value=0,
-                    kind='EV_',
-                    type_name='ENUM',
-                    choices={
-                        0: 'NoControl',
-                        1: 'SliderHoriz',
-                        2: 'SliderVert',
-                        3: 'PushButton',
-                        4: 'Edit',
-                        5: 'BitmapSwitch'
-                    }
-                )
-
-            choices = {v: k for k, v in definition.choices.items()}
-
-            self.dbc.attributes['GenEnvControlType'] = attribute.Attribute(choices[value], definition)
-
-    @property
-    def gen_env_msg_name(self):
-        return self._get_attribute('GenEnvMsgName')
-
-    @gen_env_msg_name.setter
-    def gen_env_msg_name(self, value):
-        self._set_str_attribute('GenEnvMsgName', value)
-
-    @property
-    def gen_env_msg_offset(self):
-        return self._get_attribute('GenEnvMsgOffset')
+        self._set_enum_attribute('GenEnvControlType', GEN_ENV_CONTROL_TYPE_CHOICES, value)
 
-    @gen_env_msg_offset.setter
-    def gen_env_msg_offset(self, value):
-        self._set_int_attribute('GenEnvMsgOffset', 0, 2147483647, value)
+    gen_env_msg_name = attribute.AttributeProperty('GenEnvMsgName')
 
-    @property
-    def gen_env_var_ending_dsp(self):
-        return self._get_attribute('GenEnvVarEndingDsp')
-
-    @gen_env_var_ending_dsp.setter
-    def gen_env_var_ending_dsp(self, value):
-        self._set_str_attribute('GenEnvVarEndingDsp', value)
+    gen_env_msg_offset = attribute.IntAttributeProperty('GenEnvMsgOffset', 0, 2147483647)
 
-    @property
-    def gen_env_var_ending_snd(self):
-        return self._get_attribute('GenEnvVarEndingSnd')
+    gen_env_var_ending_dsp = attribute.AttributeProperty('GenEnvVarEndingDsp')
 
-    @gen_env_var_ending_snd.setter
-    def gen_env_var_ending_snd(self, value):
-        self._set_str_attribute('GenEnvVarEndingSnd', value)
-
-    @property
-    def gen_env_var_prefix(self):
-        return self._get_attribute('GenEnvVarPrefix')
+    gen_env_var_ending_snd = attribute.AttributeProperty('GenEnvVarEndingSnd')
 
-    @gen_env_var_prefix.setter
-    def gen_env_var_prefix(self, value):
-        self._set_int_attribute('GenEnvVarPrefix', 0, 2147483647, value)
+    gen_env_var_prefix = attribute.IntAttributeProperty('GenEnvVarPrefix', 0, 2147483647)
 
-    @property
-    def gen_env_is_generated_dsp(self):
-        return bool(self._get_attribute('GenEnvIsGeneratedDsp'))
-
-    @gen_env_is_generated_dsp.setter
-    def gen_env_is_generated_dsp(self, value):
-        self._set_yes_no_attribute('GenEnvIsGeneratedDsp', value)
-
-    @property
-    def gen_env_is_generated_snd(self):
-        return bool(self._get_attribute('GenEnvIsGeneratedSnd'))
+    gen_env_is_generated_dsp = attribute.YesNoAttributeProperty('GenEnvIsGeneratedDsp')
 
-    @gen_env_is_generated_snd.setter
-    def gen_env_is_generated_snd(self, value):
-        self._set_yes_no_attribute('GenEnvIsGeneratedSnd', value)
+    gen_env_is_generated_snd = attribute.YesNoAttributeProperty('GenEnvIsGeneratedSnd')
@@ -27,18 +27,31 @@ J1939FrameId = j1939.J1939FrameId
 GMParameterId = gm_parameter_id.GMParameterId
 GMParameterIdExtended = gm_parameter_id.GMParameterIdExtended
 
+# frame id types that carry the address of the sending node, mapped to the
+# name of the attribute holding it
+SOURCE_ATTRIBUTES = {
+    J1939FrameId: 'source_address',
+    GMParameterIdExtended: 'source_id'
+}
+
 
 class FrameId(object):
+    __slots__ = ('_frame_id', '_hex')
 
     def __init__(self, frame_id):
         self._frame_id = frame_id
+        self._hex = None
 
     @property
     def hex(self):
-        if self.frame_id > 0x7FF:
-            return '0x' + hex(self.frame_id)[2:].upper().zfill(8)
-        else:
-            return '0x' + hex(self.frame_id)[2:].upper().zfill(3)
+        # the frame id cannot be changed so the string only gets built once
+        if self._hex is None:
+            if self._frame_id > 0x7FF:
+                self._hex = '0x%08X' % self._frame_id
+            else:
+                self._hex = '0x%03X' % self._frame_id
+
+        return self._hex
 
     def copy(self):
         return FrameId(self._frame_id)
@@ -52,11 +65,18 @@ class FrameId(object):
         return self._frame_id
 
     def __eq__(self, other):
+        if type(other) is FrameId:
+            return other._frame_id == self._frame_id
+
         return other == self._frame_id
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        # equal to the plain integer so both find the same dict entry
+        return hash(self._frame_id)
+
     def __str__(self):
         return str(self.frame_id)
 
@@ -22,15 +22,17 @@
 
 
 class GMParameterIdExtended(object):
+    __slots__ = ('_priority', '_parameter_id', '_source_id', '_frame_id')
 
     def __init__(self, priority, parameter_id, source_id):
         self._priority = priority
         self._parameter_id = parameter_id
         self._source_id = source_id
+        self._frame_id = None
 
     @property
     def hex(self):
-        return '0x' + hex(self.frame_id)[2:].upper().zfill(8)
+        return '0x%08X' % self.frame_id
 
     def copy(self):
         return GMParameterIdExtended(
@@ -53,18 +55,19 @@ class GMParameterIdExtended(object):
 
     @source_id.setter
     def source_id(self, source_id):
-
         self._source_id = source_id
+        self._frame_id = None
 
     @property
     def frame_id(self):
-        frame_id = self.priority & 0x7
-        frame_id <<= 13
-        frame_id |= self.parameter_id & 0x1FFF
-        frame_id <<= 13
-        frame_id |= self.source_id & 0x1FFF
+        if self._frame_id is None:
+            self._frame_id = (
+                (self._priority & 0x7) << 26 |
+                (self._parameter_id & 0x1FFF) << 13 |
+                self._source_id & 0x1FFF
+            )
 
-        return frame_id
+        return self._frame_id
 
     @classmethod
     def from_frame_id(cls, frame_id):
@@ -74,13 +77,28 @@ class GMParameterIdExtended(object):
 
         return cls(priority, parameter_id, source_id)
 
+    @staticmethod
+    def decode_bulk(frame_ids):
+        """
+        Split `frame_ids` into the GM extended fields without creating any
+        GMParameterIdExtended objects.
+
+        `frame_ids` can be anything that supports ``>>`` and ``&``, passing
+        a NumPy integer array returns a dict of arrays.
+        """
+        return {
+            'priority': (frame_ids >> 26) & 0x7,
+            'parameter_id': (frame_ids >> 13) & 0x1FFF,
+            'source_id': frame_ids & 0x1FFF
+        }
+
     def __eq__(self, other):
+        # only the parameter id takes part in the comparison
         if isinstance(other, int):
-            other = self.from_frame_id(other)
-            return other == self
+            return (other >> 13) & 0x1FFF == self._parameter_id
 
         elif isinstance(other, GMParameterIdExtended):
-            return other.parameter_id == self.parameter_id
+            return other._parameter_id == self._parameter_id
 
         return False
 
@@ -91,18 +109,15 @@ class GMParameterIdExtended(object):
         return self.frame_id
 
     def __str__(self):
-        return str(int(self))
+        return str(self.frame_id)
 
     def __repr__(self):
-        template = 'GMParameterIdExtended(priority=0x{0}, parameter_id=0x{1}, source_id=0x{3})'
-        return template.format(
-            hex(self.priority)[2:].upper(),
-            hex(self.parameter_id)[2:].upper().zfill(4),
-            hex(self.source_id)[2:].upper().zfill(4)
-        )
+        template = 'GMParameterIdExtended(priority=0x{0:X}, parameter_id=0x{1:04X}, source_id=0x{2:04X})'
+        return template.format(self._priority, self._parameter_id, self._source_id)
 
 
 class GMParameterId(object):
+    __slots__ = ('_request_type', '_arbitration_id')
 
     def __init__(self, request_type, arbitration_id):
         self._request_type = request_type
@@ -110,7 +125,7 @@ class GMParameterId(object):
 
     @property
     def hex(self):
-        return '0x' + hex(self.frame_id)[2:].upper().zfill(3)
+        return '0x%03X' % self.frame_id
 
     def copy(self):
         return GMParameterId(
@@ -137,12 +152,12 @@ class GMParameterId(object):
         return cls(request_type, arbitration_id)
 
     def __eq__(self, other):
+        # only the arbitration id takes part in the comparison
         if isinstance(other, int):
-            other = self.from_frame_id(other)
-            return other == self
+            return other & 0xFF == self._arbitration_id
 
         elif isinstance(other, GMParameterId):
-            return other.arbitration_id == self.arbitration_id
+            return other._arbitration_id == self._arbitration_id
 
         return False
 
@@ -153,11 +168,8 @@ class GMParameterId(object):
         return self.frame_id
 
     def __str__(self):
-        return str(int(self))
+        return str(self.frame_id)
 
     def __repr__(self):
-        template = 'GMParameterId(request_type=0x{0}, arbitration_id=0x{1})'
-        return template.format(
-            hex(self.request_type)[2:].upper().zfill(2),
-            hex(self.arbitration_id)[2:].upper().zfill(2)
-        )
+        template = 'GMParameterId(request_type=0x{0:02X}, arbitration_id=0x{1:02X})'
+        return template.format(self._request_type, self._arbitration_id)
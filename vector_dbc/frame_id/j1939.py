@@ -20,12 +20,59 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import bitstruct
+import functools
 
 from ..errors import Error
 
 
+# CAN traffic repeats the same few frame ids over and over so the field
+# split is cached, the caller still gets a new (mutable) instance.
+@functools.lru_cache(maxsize=4096)
+def _split_frame_id(frame_id):
+    if not 0 <= frame_id <= 0x1FFFFFFF:
+        raise Error(
+            'Expected a frame id 0..0x1fffffff, '
+            'but got {}.'.format(hex(frame_id)))
+
+    return (
+        (frame_id >> 26) & 0x7,
+        (frame_id >> 25) & 0x1,
+        (frame_id >> 24) & 0x1,
+        (frame_id >> 16) & 0xFF,
+        (frame_id >> 8) & 0xFF,
+        frame_id & 0xFF
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_pgn(pgn):
+    if not 0 <= pgn <= 0x3FFFF:
+        raise Error(
+            'Expected a parameter group number 0..0x3ffff, '
+            'but got {}.'.format(hex(pgn)))
+
+    return (
+        0,
+        (pgn >> 17) & 0x1,
+        (pgn >> 16) & 0x1,
+        (pgn >> 8) & 0xFF,
+        pgn & 0xFF,
+        0
+    )
+
+
 class J1939FrameId(object):
+    __slots__ = (
+        '_priority',
+        '_reserved',
+        '_data_page',
+        '_pdu_format',
+        '_pdu_specific',
+        '_source_address',
+        '_frame_id',
+        '_pgn'
+    )
+
     def __init__(
         self,
         priority,
@@ -41,6 +88,8 @@ class J1939FrameId(object):
         self._pdu_format = pdu_format
         self._pdu_specific = pdu_specific
         self._source_address = source_address
+        self._frame_id = None
+        self._pgn = None
 
     def copy(self):
         return J1939FrameId(
@@ -54,26 +103,44 @@ class J1939FrameId(object):
 
     @classmethod
     def from_pgn(cls, pgn):
-        try:
-            packed = bitstruct.pack('u18', pgn)
-        except bitstruct.Error:
-            raise Error(
-                'Expected a parameter group number 0..0x3ffff, '
-                'but got {}.'.format(hex(pgn)))
-
-        reserved, data_page, pdu_format, pdu_specific = bitstruct.unpack('u1u1u8u8', packed)
-        return cls(0, reserved, data_page, pdu_format, pdu_specific, 0)
+        return cls(*_split_pgn(pgn))
 
     @classmethod
     def from_frame_id(cls, frame_id):
-        try:
-            packed = bitstruct.pack('u29', frame_id)
-        except bitstruct.Error:
-            raise Error(
-                'Expected a frame id 0..0x1fffffff, '
-                'but got {}.'.format(hex(frame_id)))
+        # fills the slots directly, the frame id is already known so it
+        # is stored as the cached value as well
+        self = cls.__new__(cls)
+        (
+            self._priority,
+            self._reserved,
+            self._data_page,
+            self._pdu_format,
+            self._pdu_specific,
+            self._source_address
+        ) = _split_frame_id(frame_id)
+
+        self._frame_id = frame_id
+        self._pgn = None
+        return self
 
-        return cls(*bitstruct.unpack('u3u1u1u8u8u8', packed))
+    @staticmethod
+    def decode_bulk(frame_ids):
+        """
+        Split `frame_ids` into the J1939 fields without creating any
+        J1939FrameId objects.
+
+        `frame_ids` can be anything that supports ``>>`` and ``&``, passing
+        a NumPy integer array returns a dict of arrays. No range checking
+        is done.
+        """
+        return {
+            'priority': (frame_ids >> 26) & 0x7,
+            'reserved': (frame_ids >> 25) & 0x1,
+            'data_page': (frame_ids >> 24) & 0x1,
+            'pdu_format': (frame_ids >> 16) & 0xFF,
+            'pdu_specific': (frame_ids >> 8) & 0xFF,
+            'source_address': frame_ids & 0xFF
+        }
 
     @property
     def priority(self):
@@ -102,68 +169,90 @@ class J1939FrameId(object):
     @source_address.setter
     def source_address(self, source_address):
         self._source_address = source_address
+        self._frame_id = None
 
     @property
     def frame_id(self):
-        try:
-            packed = bitstruct.pack(
-                'u3u1u1u8u8u8', self.priority, self.reserved, self.data_page,
-                self.pdu_format, self.pdu_specific, self.source_address)
-        except bitstruct.Error:
-            if self.priority > 7:
-                raise Error('Expected priority 0..7, but got {}.'.format(self.priority))
-            elif self.reserved > 1:
-                raise Error('Expected reserved 0..1, but got {}.'.format(self.reserved))
-            elif self.data_page > 1:
-                raise Error('Expected data page 0..1, but got {}.'.format(self.data_page))
-            elif self.pdu_format > 255:
-                raise Error('Expected PDU format 0..255, but got {}.'.format(self.pdu_format))
-            elif self.pdu_specific > 255:
-                raise Error('Expected PDU specific 0..255, but got {}.'.format(self.pdu_specific))
-            elif self.source_address > 255:
-                raise Error('Expected source address 0..255, but got {}.'.format(self.source_address))
-            else:
-                raise Error('Internal error.')
-
-        return bitstruct.unpack('u29', packed)[0]
+        if self._frame_id is not None:
+            return self._frame_id
+
+        # any field that is negative or too wide leaves bits behind after
+        # the shift, the checks that build the message only run then
+        if (
+            self._priority >> 3 |
+            self._reserved >> 1 |
+            self._data_page >> 1 |
+            self._pdu_format >> 8 |
+            self._pdu_specific >> 8 |
+            self._source_address >> 8
+        ):
+            if not 0 <= self._priority <= 7:
+                raise Error('Expected priority 0..7, but got {}.'.format(self._priority))
+
+            self._check_pgn_fields()
+
+            if not 0 <= self._source_address <= 255:
+                raise Error('Expected source address 0..255, but got {}.'.format(self._source_address))
+
+        self._frame_id = (
+            self._priority << 26 |
+            self._reserved << 25 |
+            self._data_page << 24 |
+            self._pdu_format << 16 |
+            self._pdu_specific << 8 |
+            self._source_address
+        )
+
+        return self._frame_id
+
+    def _check_pgn_fields(self):
+        if not 0 <= self._reserved <= 1:
+            raise Error('Expected reserved 0..1, but got {}.'.format(self._reserved))
+        elif not 0 <= self._data_page <= 1:
+            raise Error('Expected data page 0..1, but got {}.'.format(self._data_page))
+        elif not 0 <= self._pdu_format <= 255:
+            raise Error('Expected PDU format 0..255, but got {}.'.format(self._pdu_format))
+        elif not 0 <= self._pdu_specific <= 255:
+            raise Error('Expected PDU specific 0..255, but got {}.'.format(self._pdu_specific))
 
     @property
     def hex(self):
-        return '0x' + hex(self.frame_id)[2:].upper().zfill(8)
+        return '0x%08X' % self.frame_id
 
     @property
     def pgn(self):
+        # only the source address can change and it is not part of the pgn
+        if self._pgn is not None:
+            return self._pgn
+
         if self.pdu_format < 240 and self.pdu_specific != 0:
             raise Error(
                 'Expected PDU specific 0 when PDU format is '
                 '0..239, but got {}.'.format(self.pdu_specific))
 
-        try:
-            packed = bitstruct.pack(
-                'u1u1u8u8', self.reserved, self.data_page,
-                self.pdu_format, self.pdu_specific)
-        except bitstruct.Error:
-            if self.reserved > 1:
-                raise Error('Expected reserved 0..1, but got {}.'.format(self.reserved))
-            elif self.data_page > 1:
-                raise Error('Expected data page 0..1, but got {}.'.format(self.data_page))
-            elif self.pdu_format > 255:
-                raise Error('Expected PDU format 0..255, but got {}.'.format(self.pdu_format))
-            elif self.pdu_specific > 255:
-                raise Error('Expected PDU specific 0..255, but got {}.'.format(self.pdu_specific))
-            else:
-                raise Error('Internal error.')
-
-        return bitstruct.unpack('u18', packed)[0]
+        if (
+            self._reserved >> 1 |
+            self._data_page >> 1 |
+            self._pdu_format >> 8 |
+            self._pdu_specific >> 8
+        ):
+            self._check_pgn_fields()
+
+        self._pgn = (
+            self._reserved << 17 |
+            self._data_page << 16 |
+            self._pdu_format << 8 |
+            self._pdu_specific
+        )
+
+        return self._pgn
 
     def __eq__(self, other):
         if isinstance(other, int):
-            try:
-                other = self.from_frame_id(other)
-            except Error:
+            if not 0 <= other <= 0x1FFFFFFF:
                 return False
 
-            return other == self
+            return other == self.frame_id
         elif isinstance(other, J1939FrameId):
             return other.frame_id == self.frame_id
 
@@ -176,4 +265,4 @@ class J1939FrameId(object):
         return self.frame_id
 
     def __str__(self):
-        return str(int(self))
+        return str(self.frame_id)
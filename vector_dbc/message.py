@@ -20,8 +20,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import binascii
-from copy import deepcopy
 from typing import Union
 
 from .utils import format_or
@@ -34,12 +32,23 @@ from .errors import EncodeError
 from .errors import DecodeError
 from .frame_id import J1939FrameId, GMParameterId, FrameId, GMParameterIdExtended
 from . import attribute
-from . import attribute_definition
 from . import can_data
 from .comment import MessageComment
 
 from collections import defaultdict
 
+# shared by every GenMsgSendType definition created by this module
+GEN_MSG_SEND_TYPE_CHOICES = {
+    0: 'cyclic',
+    1: 'spontaneous',
+    2: 'cyclicIfActive',
+    3: 'spontaneousWithDelay',
+    4: 'cyclicAndSpontaneous',
+    5: 'cyclicAndSpontaneousWithDelay',
+    6: 'spontaneousWithRepetition',
+    7: 'cyclicIfActiveAndSpontaneousWD'
+}
+
 
 class Message(attribute.AttributeMixin):
     """
@@ -52,6 +61,14 @@ class Message(attribute.AttributeMixin):
 
     _marker = 'BO_'
 
+    __slots__ = (
+        '_frame_id', '_dbc_frame_id', '_is_extended_frame', '_name',
+        '_length', '_signals', '_comments', '_senders',
+        '_sender_names', '_receiver_names', '_dbc',
+        '_signal_groups', '_codecs', '_signal_tree', '_signal_by_name',
+        '_strict', '_strict_checked', '_dirty', '_parent'
+    )
+
     def __init__(
         self, parent, frame_id, name, length, signals=None, comment=None, senders=None,
         dbc_specifics=None, is_extended_frame=False, signal_groups=None, strict=True
@@ -69,6 +86,7 @@ class Message(attribute.AttributeMixin):
                 'message {}.'.format(frame_id, name))
 
         self._frame_id = frame_id
+        self._dbc_frame_id = None
         self._is_extended_frame = is_extended_frame
         self._name = name
         self._length = length
@@ -80,19 +98,24 @@ class Message(attribute.AttributeMixin):
         # argument, but it is quite convenient...
         if isinstance(comment, str):
             # use the first comment in the dictionary as "The" comment
-            self._comments = {None: comment}
+            self._comments = {None: self._wrap_comment(comment)}
         elif comment is None:
             self._comments = {}
         else:
             # multi-lingual dictionary
-            self._comments = comment
+            self._comments = self._wrap_comments(comment)
 
         self._senders = senders if senders else []
         self._dbc = dbc_specifics
         self._signal_groups = signal_groups
         self._codecs = None
         self._signal_tree = None
+        self._signal_by_name = {}
+        self._sender_names = frozenset()
+        self._receiver_names = frozenset()
         self._strict = strict
+        self._strict_checked = False
+        self._dirty = True
         self._parent = parent
         self.refresh()
 
@@ -100,10 +123,22 @@ class Message(attribute.AttributeMixin):
     def database(self):
         return self._parent
 
-    def _create_codec(self, parent_signal=None, multiplexer_id=None):
+    def _create_codec(self, parent_signal=None, multiplexer_id=None, mux_names=None):
         """Create a codec of all signals with given parent signal. This is a recursive function."""
         multiplexers = defaultdict(dict)
 
+        # (signal, multiplexer signal name) pairs, the name is None for
+        # signals that are not multiplexed. worked out once for the whole
+        # tree instead of going through the properties on every level
+        if mux_names is None:
+            mux_names = []
+            for signal in self._signals:
+                multiplexer = signal._get_mux()
+                if multiplexer is None:
+                    mux_names.append((signal, None))
+                else:
+                    mux_names.append((signal, multiplexer.multiplexer_signal.name))
+
         # Find all signals matching given parent signal name and given
         # multiplexer id. Root signals' parent and multiplexer id are
         # both None.
@@ -111,10 +146,9 @@ class Message(attribute.AttributeMixin):
             if signal.is_multiplexer:
                 children_ids = [
                     item
-                    for s in self._signals
-                    for item in s.multiplexer
-                    if s.multiplexer.is_ok
-                    and s.multiplexer.multiplexer_signal.name != signal.name
+                    for s, name in mux_names
+                    if name is not None and name != signal.name
+                    for item in s._multiplexer
                 ]
 
                 # Some CAN messages will have muxes containing only
@@ -127,41 +161,64 @@ class Message(attribute.AttributeMixin):
                     children_ids += list(signal.choices.keys())
 
                 multiplexers[signal.name].update(
-                    {child_id: self._create_codec(signal.name, child_id) for child_id in set(children_ids)}
+                    {
+                        child_id: self._create_codec(signal.name, child_id, mux_names)
+                        for child_id in set(children_ids)
+                    }
                 )
 
             return signal
 
         signals = [
             _do1(signal)
-            for signal in self._signals
+            for signal, name in mux_names
             if (
-                (signal.multiplexer.is_ok is False or signal.multiplexer.multiplexer_signal.name == parent_signal) and
-                (multiplexer_id is None or multiplexer_id in signal.multiplexer)
+                (name is None or name == parent_signal) and
+                (
+                    multiplexer_id is None or
+                    (signal._multiplexer is not None and multiplexer_id in signal._multiplexer)
+                )
             )
         ]
 
+        formats = create_encode_decode_formats(signals, self._length)
+
         return {
             'signals': signals,
-            'formats': create_encode_decode_formats(signals, self._length),
-            'multiplexers': multiplexers
+            'formats': formats,
+            'padding_mask': formats.padding_mask,
+            'multiplexers': multiplexers,
+            # (signal name, codecs by mux id) pairs walked by
+            # _encode/_decode
+            'mux_plan': tuple(multiplexers.items())
         }
 
     def _create_signal_tree(self, codec):
-        """Create a multiplexing tree node of given codec. This is a recursive function."""
-        nodes = [
-            {
-                signal.name: {
-                    mux: self._create_signal_tree(mux_codec)
-                    for mux, mux_codec in  codec['multiplexers'][signal.name].items()
-                }
-            }
-            if signal.name in codec['multiplexers']
-            else signal.name
-            for signal in codec['signals']
-        ]
+        """Create a multiplexing tree node of given codec."""
+        tree = []
+        stack = [(codec, tree)]
 
-        return nodes
+        # walked with a stack instead of recursion, every child list is
+        # put in place before it is filled so the order is unchanged
+        while stack:
+            codec, nodes = stack.pop()
+            multiplexers = codec['multiplexers']
+
+            for signal in codec['signals']:
+                name = signal.name
+
+                if name in multiplexers:
+                    children = {}
+
+                    for mux, mux_codec in multiplexers[name].items():
+                        children[mux] = []
+                        stack.append((mux_codec, children[mux]))
+
+                    nodes.append({name: children})
+                else:
+                    nodes.append(name)
+
+        return tree
 
     @property
     def frame_id(self) -> Union[FrameId, J1939FrameId, GMParameterId, GMParameterIdExtended]:
@@ -187,6 +244,7 @@ class Message(attribute.AttributeMixin):
     @frame_id.setter
     def frame_id(self, value):
         self._frame_id = value
+        self._dbc_frame_id = None
 
     @property
     def is_extended_frame(self):
@@ -196,6 +254,7 @@ class Message(attribute.AttributeMixin):
     @is_extended_frame.setter
     def is_extended_frame(self, value):
         self._is_extended_frame = value
+        self._dbc_frame_id = None
 
     @property
     def name(self):
@@ -214,35 +273,50 @@ class Message(attribute.AttributeMixin):
     @length.setter
     def length(self, value):
         self._length = value
+        self._dirty = True
 
     @property
     def signals(self):
         """A list of all signals in the message."""
+        # the list can be changed in place by the caller
+        self._dirty = True
         return self._signals
 
     @property
     def signal_groups(self):
         """A list of all signal groups in the message."""
+        self._dirty = True
         return self._signal_groups
 
     @signal_groups.setter
     def signal_groups(self, value):
         self._signal_groups = value
+        self._dirty = True
 
-    @property
-    def comments(self):
-        """The dictionary with the descriptions of the signal in multiple languages. ``None`` if unavailable."""
+    def _wrap_comment(self, val):
+        if isinstance(val, MessageComment):
+            return val
 
-        for key, val in list(self._comments.items())[:]:
-            if val is not None:
-                if isinstance(val, bytes):
-                    val = val.decode('utf-8')
-                if not isinstance(val, MessageComment):
-                    val = MessageComment(val)
-                    val.message = self
+        if isinstance(val, bytes):
+            val = val.decode('utf-8')
 
-                self._comments[key] = val
+        val = MessageComment(val)
+        val.message = self
+        return val
 
+    def _wrap_comments(self, comments):
+        # comments are decoded and wrapped when they are stored so the
+        # getters don't have to. the dict passed in belongs to the caller
+        # and is left as it is
+        wrap = self._wrap_comment
+        return {
+            key: val if val is None or type(val) is MessageComment else wrap(val)
+            for key, val in comments.items()
+        }
+
+    @property
+    def comments(self):
+        """The dictionary with the descriptions of the signal in multiple languages. ``None`` if unavailable."""
         return self._comments
 
     @comments.setter
@@ -253,16 +327,7 @@ class Message(attribute.AttributeMixin):
         if not isinstance(value, dict):
             raise TypeError('passed value is not a dictionary `dict`')
 
-        for key, val in list(value.items())[:]:
-            if val is not None:
-                if isinstance(val, bytes):
-                    val = val.decode('utf-8')
-                if not isinstance(val, (str, MessageComment)):
-                    val = str(val)
-
-                value[key] = val
-
-        self._comments = value
+        self._comments = self._wrap_comments(value)
 
     @property
     def comment(self):
@@ -272,55 +337,41 @@ class Message(attribute.AttributeMixin):
         Note that we implicitly try to return the comment's language
         to be English comment if multiple languages were specified.
         """
-        comment = self._comments.get(None, None)
+        comments = self._comments
+        comment = comments.get(None, None)
 
-        if comment is None:
-            comment = self._comments.get('EN', None)
+        # already wrapped, nothing else to do
+        if type(comment) is MessageComment:
+            return comment
 
-            if comment is not None:
-                if isinstance(comment, bytes):
-                    comment = comment.decode('utf-8')
-
-                if not isinstance(comment, MessageComment):
-                    comment = MessageComment(comment)
-                    comment.message = self
-                    self._comments['EN'] = comment
+        if comment is None:
+            comment = comments.get('EN', None)
 
-        else:
-            if isinstance(comment, bytes):
-                comment = comment.decode('utf-8')
+            if comment is not None and type(comment) is not MessageComment:
+                comment = comments['EN'] = self._wrap_comment(comment)
 
-            if not isinstance(comment, MessageComment):
-                comment = MessageComment(comment)
-                comment.message = self
-                self._comments[None] = comment
+            return comment
 
+        comment = comments[None] = self._wrap_comment(comment)
         return comment
 
     @comment.setter
     def comment(self, value):
-        if isinstance(value, bytes):
-            value = value.decode('utf-8')
-
-        if value is not None and not isinstance(value, (str, MessageComment)):
-            value = str(value)
+        if value is not None:
+            value = self._wrap_comment(value)
 
         self._comments = {None: value}
 
     @property
     def senders(self):
         """A list of all sender nodes of this message."""
-        senders = [node for node in self.database.nodes if node.name in self._senders]
+        senders = [node for node in self.database.nodes if node.name in self._sender_names]
         return senders
 
     @property
     def receivers(self):
         """A list of all receiver nodes attached to signals in this message"""
-        receivers = set(
-            receiver.name
-            for signal in self.signals
-            for receiver in signal.receivers
-        )
+        receivers = self._receiver_names
         return [node for node in self.database.nodes if node.name in receivers]
 
     @property
@@ -352,27 +403,29 @@ class Message(attribute.AttributeMixin):
 
     def _check_signals_ranges_scaling(self, signals, data):
         for signal in signals:
-            value = data[signal.name]
+            value = data[signal._name]
 
             # Choices are checked later.
             if isinstance(value, str):
                 continue
 
-            if signal.minimum is not None and value < signal.minimum:
+            minimum = signal._minimum
+            if minimum is not None and value < minimum:
                 raise EncodeError(
                     "Expected signal '{}' value greater than or equal to "
                     "{} in message '{}', but got {}.".format(
-                        signal.name, signal.minimum, self._name, value))
+                        signal.name, minimum, self._name, value))
 
-            if signal.maximum is not None and value > signal.maximum:
+            maximum = signal._maximum
+            if maximum is not None and value > maximum:
                 raise EncodeError(
                     "Expected signal '{}' value less than or equal to "
                     "{} in message '{}', but got {}.".format(
-                        signal.name, signal.maximum, self.name, value))
+                        signal.name, maximum, self.name, value))
 
     def _check_signals(self, signals, data, scaling):
         for signal in signals:
-            if signal.name not in data:
+            if signal._name not in data:
                 if signal.gen_sig_start_value is not None:
                     data[signal.name] = signal.gen_sig_start_value + signal.offset
                 else:
@@ -383,31 +436,36 @@ class Message(attribute.AttributeMixin):
         if scaling:
             self._check_signals_ranges_scaling(signals, data)
 
-    def _encode(self, node, data, scaling, strict):
+    def _encode(self, node, data, scaling, strict, padding_masks):
         if strict:
             self._check_signals(node['signals'], data, scaling)
 
         encoded = encode_data(
             data, node['signals'], node['formats'], scaling)
-        padding_mask = node['formats'].padding_mask
-        multiplexers = node['multiplexers']
 
-        for signal in multiplexers:
-            mux = self._get_mux_number(data, signal)
+        # the masks are only collected when padding was asked for
+        if padding_masks is not None:
+            padding_masks.append(node['padding_mask'])
+
+        for signal, mux_codecs in node['mux_plan']:
+            mux = data[signal]
+
+            # plain ints are by far the most common, only anything else
+            # can be a choice string that needs converting
+            if type(mux) is not int:
+                mux = self._get_mux_number(data, signal)
 
             try:
-                node = multiplexers[signal][mux]
+                node = mux_codecs[mux]
             except KeyError:
                 raise EncodeError(
                     'expected multiplexer id {}, but got '
-                    '{}'.format(format_or(multiplexers[signal]), mux))
+                    '{}'.format(format_or(mux_codecs), mux))
 
-            mux_encoded, mux_padding_mask = self._encode(
-                node, data, scaling, strict)
-            encoded |= mux_encoded
-            padding_mask &= mux_padding_mask
+            encoded |= self._encode(
+                node, data, scaling, strict, padding_masks)
 
-        return encoded, padding_mask
+        return encoded
 
     def encode(self, data, scaling=True, padding=False, strict=True):
         """
@@ -421,16 +479,24 @@ class Message(attribute.AttributeMixin):
         allowed ranges, or an exception is raised.
         """
 
-        encoded, padding_mask = self._encode(
-            self._codecs, data, scaling, strict)
-
         if padding:
+            padding_masks = []
+            encoded = self._encode(
+                self._codecs, data, scaling, strict, padding_masks)
+
+            # a bit is padding only if no visited codec uses it
+            padding_mask = padding_masks[0]
+            for mask in padding_masks[1:]:
+                padding_mask &= mask
+
             encoded |= padding_mask
+        else:
+            encoded = self._encode(
+                self._codecs, data, scaling, strict, None)
 
-        encoded |= (0x80 << (8 * self._length))
-        encoded = hex(encoded)[4:].rstrip('L')
+        encoded &= (1 << (8 * self._length)) - 1
 
-        data = can_data.TXData(binascii.unhexlify(encoded)[:self._length])
+        data = can_data.TXData(encoded.to_bytes(self._length, 'big'))
         data.frame_id = self.frame_id
 
         return data
@@ -444,17 +510,20 @@ class Message(attribute.AttributeMixin):
             scaling
         )
 
-        multiplexers = node['multiplexers']
+        for signal, mux_codecs in node['mux_plan']:
+            mux = decoded[signal]
 
-        for signal in multiplexers:
-            mux = self._get_mux_number(decoded, signal)
+            # plain ints are by far the most common, only anything else
+            # can be a choice string that needs converting
+            if type(mux) is not int:
+                mux = self._get_mux_number(decoded, signal)
 
             try:
-                node = multiplexers[signal][mux]
+                node = mux_codecs[mux]
             except KeyError:
                 raise DecodeError(
                     'expected multiplexer id {}, but got '
-                    '{}'.format(format_or(multiplexers[signal]), mux))
+                    '{}'.format(format_or(mux_codecs), mux))
 
             decoded.update(self._decode(
                 node, data, decode_choices, scaling))
@@ -476,17 +545,55 @@ class Message(attribute.AttributeMixin):
         res = can_data.RXData()
         res.frame_id = self.frame_id
 
-        for key, value in list(data.items())[:]:
+        for key, value in data.items():
             signal = self.get_signal_by_name(key)
             signal._value = value
             res += [signal]
 
         return res
 
+    def decode_many(self, frames, decode_choices=True, scaling=True):
+        """
+        Decode several frames of this message type.
+
+        Returns a dictionary mapping each signal name to a list with one
+        value per frame, ``None`` where the signal is not part of the
+        frame (multiplexed signals). The signal objects are not updated
+        like :meth:`decode` does, the lists can be handed to NumPy or
+        pandas as columns.
+        """
+        length = self._length
+        codecs = self._codecs
+        decode = self._decode
+        columns = {}
+
+        for index, data in enumerate(frames):
+            decoded = decode(codecs, data[:length], decode_choices, scaling)
+
+            for name, value in decoded.items():
+                column = columns.get(name)
+
+                if column is None:
+                    columns[name] = [None] * index + [value]
+                else:
+                    column.append(value)
+
+            # signals missing from this frame
+            for column in columns.values():
+                if len(column) == index:
+                    column.append(None)
+
+        return columns
+
     def get_signal_by_name(self, name):
-        signal = [signal for signal in self.signals if signal.name == name]
-        if len(signal):
-            return signal[0]
+        signal = self._signal_by_name.get(name, None)
+        if signal is not None and signal._name == name:
+            return signal
+
+        # signals added or renamed since the last refresh
+        for signal in self._signals:
+            if signal._name == name:
+                return signal
 
         raise KeyError(name)
 
@@ -495,27 +602,17 @@ class Message(attribute.AttributeMixin):
         return bool(self._codecs['multiplexers'])
 
     def _check_signal(self, message_bits, signal):
-        signal_bits = signal.length * [signal.name]
+        message_length = len(message_bits)
+        length = signal.length
 
         if signal.byte_order == 'big_endian':
-            padding = start_bit(signal) * [None]
-            signal_bits = padding + signal_bits
+            first = start_bit(signal)
+            end = first + length
         else:
-            signal_bits += signal.start * [None]
-
-            if len(signal_bits) < len(message_bits):
-                padding = (len(message_bits) - len(signal_bits)) * [None]
-                reversed_signal_bits = padding + signal_bits
-            else:
-                reversed_signal_bits = signal_bits
-
-            signal_bits = []
-
-            for i in range(0, len(reversed_signal_bits), 8):
-                signal_bits = reversed_signal_bits[i:i + 8] + signal_bits
+            end = length + signal.start
 
         # Check that the signal fits in the message.
-        if len(signal_bits) > len(message_bits):
+        if end > message_length:
             print(
                 'The signal {} does not fit in message {}.'.format(
                     signal.name, self.name))
@@ -525,32 +622,42 @@ class Message(attribute.AttributeMixin):
             #         signal.name,
             #         self.name))
 
+        # offsets into message_bits that the signal occupies, worked out
+        # directly instead of building and byte swapping a list of bits
+        if signal.byte_order == 'big_endian':
+            signal_bits = range(first, end)
+        else:
+            last_byte = message_length // 8 - 1
+            signal_bits = sorted(
+                (last_byte - i // 8) * 8 + i % 8
+                for i in range(message_length - end, message_length - signal.start)
+            )
+
         # Check that the signal does not overlap with other
         # signals.
-        for offset, signal_bit in enumerate(signal_bits):
-            if signal_bit is not None:
-                if message_bits[offset] is not None:
-                    print(
-                        'The signals {} and {} are overlapping in message {}.'.format(
-                            signal.name, message_bits[offset], self.name))
+        for offset in signal_bits:
+            if message_bits[offset] is not None:
+                print(
+                    'The signals {} and {} are overlapping in message {}.'.format(
+                        signal.name, message_bits[offset], self.name))
 
-                    for i, name in enumerate(message_bits):
-                        if name == signal_bit:
-                            message_bits[i] = None
+                for i, name in enumerate(message_bits):
+                    if name == signal.name:
+                        message_bits[i] = None
 
-                    return
+                return
 
-                message_bits[offset] = signal.name
+            message_bits[offset] = signal.name
 
     def _check_mux(self, message_bits, mux):
-        signal_name, children = list(mux.items())[0]
+        signal_name, children = next(iter(mux.items()))
         self._check_signal(
             message_bits, self.get_signal_by_name(signal_name))
-        children_message_bits = deepcopy(message_bits)
+        children_message_bits = message_bits[:]
 
         for multiplexer_id in sorted(children):
             child_tree = children[multiplexer_id]
-            child_message_bits = deepcopy(children_message_bits)
+            child_message_bits = children_message_bits[:]
             self._check_signal_tree(child_message_bits, child_tree)
 
             for i, child_bit in enumerate(child_message_bits):
@@ -569,7 +676,7 @@ class Message(attribute.AttributeMixin):
 
         errors = [
             signal
-            for signal in self.signals
+            for signal in self._signals
             if signal.length <= 0
         ]
         if errors:
@@ -579,7 +686,7 @@ class Message(attribute.AttributeMixin):
                 'message {}.'.format(signal.name, signal.length, self.name)
             )
 
-    def refresh(self, strict=None):
+    def refresh(self, strict=None, force=False):
         """
         Refresh the internal message state.
 
@@ -587,239 +694,162 @@ class Message(attribute.AttributeMixin):
         are overlapping or if they don't fit in the message. This
         argument overrides the value of the same argument passed to
         the constructor.
+
+        Nothing is rebuilt if the message has not changed since the last
+        refresh, set `force` to ``True`` to rebuild it anyway.
         """
 
-        for signal in self._signals:
-            signal._parent = self
+        if strict is None:
+            strict = self._strict
+
+        if not (force or self._dirty or (strict and not self._strict_checked)):
+            return
 
         for signal_group in self._signal_groups:
             signal_group._parent = self
 
+        # sorting only looks at the start bit and byte order so the
+        # parent can be set in the same pass that indexes the names
         self._signals.sort(key=start_bit)
+
+        signal_by_name = {}
+        for signal in self._signals:
+            signal._parent = self
+            signal_by_name.setdefault(signal.name, signal)
+
+        self._signal_by_name = signal_by_name
+
+        # node names only, the nodes themselves are looked up in the
+        # database when the property is read
+        self._sender_names = frozenset(self._senders)
+        self._receiver_names = frozenset(
+            name
+            for signal in self._signals
+            for name in signal._receivers
+        )
+
         self._check_signal_lengths()
         self._codecs = self._create_codec()
         self._signal_tree = self._create_signal_tree(self._codecs)
 
-        if strict is None:
-            strict = self._strict
-
         if strict:
             message_bits = 8 * self.length * [None]
             self._check_signal_tree(message_bits, self.signal_tree)
 
-    @property
-    def gen_msg_delay_time(self):
-        """
+        self._strict_checked = bool(strict)
+        self._dirty = False
+
+    gen_msg_delay_time = attribute.IntAttributeProperty(
+        'GenMsgDelayTime', 0, 2147483647,
+        doc="""
         Defines the minimum time between two message transmissions.
         """
-        return self._get_attribute('GenMsgDelayTime')
-
-    @gen_msg_delay_time.setter
-    def gen_msg_delay_time(self, value):
-        self._set_int_attribute('GenMsgDelayTime', 0, 2147483647, value)
+    )
 
-    @property
-    def gen_msg_cycle_time(self):
-        """
+    gen_msg_cycle_time = attribute.IntAttributeProperty(
+        'GenMsgCycleTime', 0, 2147483647,
+        doc="""
         Defines the fixed periodicity for cyclic message transmissions.
         """
-        return self._get_attribute('GenMsgCycleTime')
+    )
 
-    @gen_msg_cycle_time.setter
-    def gen_msg_cycle_time(self, value):
-        self._set_int_attribute('GenMsgCycleTime', 0, 2147483647, value)
-
-    @property
-    def gen_msg_cycle_time_fast(self):
-        """
+    gen_msg_cycle_time_fast = attribute.IntAttributeProperty(
+        'GenMsgCycleTimeFast', 0, 2147483647,
+        doc="""
         Defines the periodicity for fast message transmissions.
 
         Messages are transmitted fast if one of the signals placed on the message is in an active state.
         """
-        return self._get_attribute('GenMsgCycleTimeFast')
-
-    @gen_msg_cycle_time_fast.setter
-    def gen_msg_cycle_time_fast(self, value):
-        self._set_int_attribute('GenMsgCycleTimeFast', 0, 2147483647, value)
+    )
 
-    @property
-    def gen_msg_cycle_time_active(self):
-        """
+    gen_msg_cycle_time_active = attribute.IntAttributeProperty(
+        'GenMsgCycleTimeActive', 0, 2147483647,
+        doc="""
         Same as GenMsgCycleTimeFast for the CAPL Generators interaction layer.
         """
-        return self._get_attribute('GenMsgCycleTimeActive')
-
-    @gen_msg_cycle_time_active.setter
-    def gen_msg_cycle_time_active(self, value):
-        self._set_int_attribute('GenMsgCycleTimeActive', 0, 2147483647, value)
+    )
 
-    @property
-    def gen_msg_start_delay_time(self):
-        """
+    gen_msg_start_delay_time = attribute.IntAttributeProperty(
+        'GenMsgStartDelayTime', 0, 2147483647,
+        doc="""
         Defines the delay after system start-up, the message is sent the first time.
         """
-        return self._get_attribute('GenMsgStartDelayTime')
+    )
 
-    @gen_msg_start_delay_time.setter
-    def gen_msg_start_delay_time(self, value):
-        self._set_int_attribute('GenMsgStartDelayTime', 0, 2147483647, value)
-
-    @property
-    def gen_msg_nr_of_repetition(self):
-        """
+    gen_msg_nr_of_repetition = attribute.IntAttributeProperty(
+        'GenMsgNrOfRepetition', 0, 2147483647,
+        doc="""
         If the transmission of a message has to be repeated,
         this attribute defines the number how often it will be repeated.
 
         If a message transmission is repeated depends on the value of GenSigSendType
         of the signals placed on the message.
         """
-        return self._get_attribute('GenMsgNrOfRepetition')
-
-    @gen_msg_nr_of_repetition.setter
-    def gen_msg_nr_of_repetition(self, value):
-        self._set_int_attribute('GenMsgNrOfRepetition', 0, 2147483647, value)
+    )
 
-    @property
-    def gen_msg_fast_on_start(self):
-        """
+    gen_msg_fast_on_start = attribute.IntAttributeProperty(
+        'GenMsgFastOnStart', 0, 2147483647,
+        doc="""
         Defines the time duration in milliseconds to send cyclic messages with a
         faster cycle time (GenMsgCycleTimeFast) after the IL is started.
 
         This works only if the normal as well as the fast cycle time are defined
         with values > 0.
         """
-        return self._get_attribute('GenMsgFastOnStart')
+    )
 
-    @gen_msg_fast_on_start.setter
-    def gen_msg_fast_on_start(self, value):
-        self._set_int_attribute('GenMsgFastOnStart', 0, 2147483647, value)
-
-    @property
-    def gen_msg_il_support(self):
-        """
+    gen_msg_il_support = attribute.YesNoAttributeProperty(
+        'GenMsgILSupport',
+        doc="""
         Set to Yes if the message is handled by the interaction layer.
         """
-        return bool(self._get_attribute('GenMsgILSupport'))
-
-    @gen_msg_il_support.setter
-    def gen_msg_il_support(self, value):
-        self._set_yes_no_attribute('GenMsgILSupport', int(value))
+    )
 
-    @property
-    def tp_j1939_var_dlc(self):
-        """
+    tp_j1939_var_dlc = attribute.YesNoAttributeProperty(
+        'TpJ1939VarDlc',
+        doc="""
         Set to Yes if the message is handled by the interaction layer.
         """
-        return bool(self._get_attribute('TpJ1939VarDlc'))
+    )
 
-    @tp_j1939_var_dlc.setter
-    def tp_j1939_var_dlc(self, value):
-        self._set_yes_no_attribute('TpJ1939VarDlc', int(value))
-
-    @property
-    def diag_request(self):
-        """
+    diag_request = attribute.YesNoAttributeProperty(
+        'DiagRequest',
+        doc="""
         Specifies that the message is used for a diagnostic request.
         """
-        return bool(self._get_attribute('DiagRequest'))
+    )
 
-    @diag_request.setter
-    def diag_request(self, value):
-        self._set_yes_no_attribute('DiagRequest', int(value))
-
-    @property
-    def diag_response(self):
-        """
+    diag_response = attribute.YesNoAttributeProperty(
+        'DiagResponse',
+        doc="""
         Specifies that the message is used for a diagnostic response.
         """
-        return bool(self._get_attribute('DiagResponse'))
-
-    @diag_response.setter
-    def diag_response(self, value):
-        self._set_yes_no_attribute('DiagResponse', int(value))
+    )
 
-    @property
-    def nm_message(self):
-        """
+    nm_message = attribute.YesNoAttributeProperty(
+        'NmMessage',
+        doc="""
         Specifies that the message is used as a network management message of a particular node.
         """
-        return bool(self._get_attribute('NmMessage'))
+    )
 
-    @nm_message.setter
-    def nm_message(self, value):
-        self._set_yes_no_attribute('NmMessage', int(value))
+    gen_msg_auto_gen_dsp = attribute.YesNoAttributeProperty('GenMsgAutoGenDsp')
 
-    @property
-    def gen_msg_auto_gen_dsp(self):
-        return bool(self._get_attribute('GenMsgAutoGenDsp'))
+    gen_msg_auto_gen_snd = attribute.YesNoAttributeProperty('GenMsgAutoGenSnd')
 
-    @gen_msg_auto_gen_dsp.setter
-    def gen_msg_auto_gen_dsp(self, value):
-        self._set_yes_no_attribute('GenMsgAutoGenDsp', int(value))
+    gen_msg_alt_setting = attribute.AttributeProperty('GenMsgAltSetting')
 
-    @property
-    def gen_msg_auto_gen_snd(self):
-        return bool(self._get_attribute('GenMsgAutoGenSnd'))
+    gen_msg_conditional_send = attribute.AttributeProperty('GenMsgConditionalSend')
 
-    @gen_msg_auto_gen_snd.setter
-    def gen_msg_auto_gen_snd(self, value):
-        self._set_yes_no_attribute('GenMsgAutoGenSnd', int(value))
+    gen_msg_ev_name = attribute.AttributeProperty('GenMsgEVName')
 
-    @property
-    def gen_msg_alt_setting(self):
-        return self._get_attribute('GenMsgAltSetting')
+    gen_msg_post_if_setting = attribute.AttributeProperty('GenMsgPostIfSetting')
 
-    @gen_msg_alt_setting.setter
-    def gen_msg_alt_setting(self, value):
-        self._set_str_attribute('GenMsgAltSetting', value)
+    gen_msg_post_setting = attribute.AttributeProperty('GenMsgPostSetting')
 
-    @property
-    def gen_msg_conditional_send(self):
-        return self._get_attribute('GenMsgConditionalSend')
+    gen_msg_pre_if_setting = attribute.AttributeProperty('GenMsgPreIfSetting')
 
-    @gen_msg_conditional_send.setter
-    def gen_msg_conditional_send(self, value):
-        self._set_str_attribute('GenMsgConditionalSend', value)
-
-    @property
-    def gen_msg_ev_name(self):
-        return self._get_attribute('GenMsgEVName')
-
-    @gen_msg_ev_name.setter
-    def gen_msg_ev_name(self, value):
-        self._set_str_attribute('GenMsgEVName', value)
-
-    @property
-    def gen_msg_post_if_setting(self):
-        return self._get_attribute('GenMsgPostIfSetting')
-
-    @gen_msg_post_if_setting.setter
-    def gen_msg_post_if_setting(self, value):
-        self._set_str_attribute('GenMsgPostIfSetting', value)
-
-    @property
-    def gen_msg_post_setting(self):
-        return self._get_attribute('GenMsgPostSetting')
-
-    @gen_msg_post_setting.setter
-    def gen_msg_post_setting(self, value):
-        self._set_str_attribute('GenMsgPostSetting', value)
-
-    @property
-    def gen_msg_pre_if_setting(self):
-        return self._get_attribute('GenMsgPreIfSetting')
-
-    @gen_msg_pre_if_setting.setter
-    def gen_msg_pre_if_setting(self, value):
-        self._set_str_attribute('GenMsgPreIfSetting', value)
-
-    @property
-    def gen_msg_pre_setting(self):
-        return self._get_attribute('GenMsgPreSetting')
-
-    @gen_msg_pre_setting.setter
-    def gen_msg_pre_setting(self, value):
-        self._set_str_attribute('GenMsgPreSetting', value)
+    gen_msg_pre_setting = attribute.AttributeProperty('GenMsgPreSetting')
 
     @property
     def gen_msg_send_type(self):
@@ -829,47 +859,23 @@ class Message(attribute.AttributeMixin):
         This attribute together with the send types of the signals placed on the
         message define the overall transmit behavior of the message.
         """
-        if 'GenMsgSendType' in self.dbc.attributes:
-            value = self.dbc.attributes['GenMsgSendType'].value
-            return self.dbc.attributes['GenMsgSendType'].definition.choices[value]
+        return self._get_enum_attribute('GenMsgSendType')
 
     @gen_msg_send_type.setter
     def gen_msg_send_type(self, value):
-        if 'GenMsgSendType' in self.dbc.attributes:
-            self.dbc.attributes['GenMsgSendType'].value = value
-        else:
-            if 'GenMsgSendType' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['GenMsgSendType']
-            else:
-                definition = attribute_definition.AttributeDefinition(
-                    'GenSigSendType',
-                    default_value=0,
-                    kind='SG_',
-                    type_name='ENUM',
-                    choices={
-                        0: 'cyclic',
-                        1: 'spontaneous',
-                        2: 'cyclicIfActive',
-                        3: 'spontaneousWithDelay',
-                        4: 'cyclicAndSpontaneous',
-                        5: 'cyclicAndSpontaneousWithDelay',
-                        6: 'spontaneousWithRepetition',
-                        7: 'cyclicIfActiveAndSpontaneousWD'
-                    }
-                )
-
-            choices = {v: k for k, v in definition.choices.items()}
-
-            self.dbc.attributes['GenMsgSendType'] = attribute.Attribute(choices[value], definition)
+        self._set_enum_attribute('GenMsgSendType', GEN_MSG_SEND_TYPE_CHOICES, value)
 
     @property
     def dbc_frame_id(self):
-        frame_id = int(self.frame_id)
+        if self._dbc_frame_id is None:
+            frame_id = int(self.frame_id)
+
+            if self._is_extended_frame:
+                frame_id |= 0x80000000
 
-        if self.is_extended_frame:
-            frame_id |= 0x80000000
+            self._dbc_frame_id = frame_id
 
-        return frame_id
+        return self._dbc_frame_id
 
     def __str__(self):
         res = [
@@ -882,7 +888,7 @@ class Message(attribute.AttributeMixin):
         ]
 
         res += [
-            str(signal) for signal in self.signals[::-1]
+            str(signal) for signal in self._signals[::-1]
         ]
 
         return '\n'.join(res)
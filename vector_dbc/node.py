@@ -20,14 +20,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import functools
+
 from . import attribute
-from . import attribute_definition
 from . import ecu
 from .comment import NodeComment
-from .frame_id import (
-    J1939FrameId,
-    GMParameterIdExtended
-)
+from .frame_id import SOURCE_ATTRIBUTES
+
+
+# a log reader passes the same few message names in over and over
+@functools.lru_cache(maxsize=1024)
+def _decode_name(name):
+    return name.decode('utf-8')
 
 
 class Node(attribute.AttributeMixin):
@@ -35,16 +39,32 @@ class Node(attribute.AttributeMixin):
 
     _marker = 'BU_'
 
+    __slots__ = ('_name', '_comment', '_dbc', '_parent', '_tp_tx_cache')
+
     def __init__(self, parent, name, comment, dbc_specifics=None):
         self._name = name
-        self._comment = comment
+        self._comment = None
+        self.comment = comment
         self._dbc = dbc_specifics
         self._parent = parent
+        # (TpTxIdentifier,) once read, decode looks at it for every frame
+        self._tp_tx_cache = None
+
+    def _in_nodes(self, message, names, attr_name):
+        if self._name not in names:
+            return False
+
+        if self._parent._name_to_node.get(self._name) is self:
+            return True
+
+        # same name but not the node the database indexed, fall back to
+        # building the node list of the message
+        return self in getattr(message, attr_name)
 
     def encode(self, frame_id_or_name, data, scaling=True, padding=False, strict=True):
         message = self._parent.get_message(frame_id_or_name)
 
-        if self not in message.senders:
+        if not self._in_nodes(message, message._sender_names, 'senders'):
             raise KeyError(frame_id_or_name)
 
         data = message.encode(data, scaling, padding, strict)
@@ -54,16 +74,26 @@ class Node(attribute.AttributeMixin):
 
     def decode(self, frame_id_or_name, data, decode_choices=True, scaling=True):
         if isinstance(frame_id_or_name, bytes):
-            frame_id_or_name = frame_id_or_name.decode('utf-8')
+            frame_id_or_name = _decode_name(frame_id_or_name)
 
         message = self._parent.get_message(frame_id_or_name)
 
-        if self not in message.receivers:
+        if not self._in_nodes(message, message._receiver_names, 'receivers'):
             raise KeyError(frame_id_or_name)
 
-        tp_tx_indentfier = self.tp_tx_indentfier
+        cache = self._tp_tx_cache
+        tp_tx_indentfier = self.tp_tx_indentfier if cache is None else cache[0]
+
+        # exact types first, they are what a bus reader passes in
+        frame_id_type = type(frame_id_or_name)
 
-        if isinstance(frame_id_or_name, int):
+        if frame_id_type is int:
+            frame_id = message.frame_id.from_frame_id(frame_id_or_name)
+
+        elif frame_id_type is str:
+            frame_id = message.frame_id
+
+        elif isinstance(frame_id_or_name, int):
             frame_id = message.frame_id.from_frame_id(frame_id_or_name)
 
         elif isinstance(frame_id_or_name, str):
@@ -73,10 +103,9 @@ class Node(attribute.AttributeMixin):
             frame_id = frame_id_or_name
 
         if tp_tx_indentfier is not None:
-            if (
-                (isinstance(frame_id, J1939FrameId) and frame_id.source_address != tp_tx_indentfier) or
-                (isinstance(frame_id, GMParameterIdExtended) and frame_id.source_id != tp_tx_indentfier)
-            ):
+            attr_name = SOURCE_ATTRIBUTES.get(type(frame_id))
+
+            if attr_name is not None and getattr(frame_id, attr_name) != tp_tx_indentfier:
                 raise KeyError(frame_id_or_name)
 
         data = message.decode(data, decode_choices, scaling)
@@ -84,23 +113,39 @@ class Node(attribute.AttributeMixin):
 
         return data
 
+    def _get_signals(self, index, attr_name):
+        if self._parent._name_to_node.get(self._name) is self:
+            signals = self._parent._get_node_signals().get(self._name)
+            if signals is None:
+                return ()
+
+            return signals[index]
+
+        return tuple(
+            signal for message in self._parent.messages
+            if self in getattr(message, attr_name)
+            for signal in message._signals
+        )
+
     @property
     def tx_signals(self):
-        signals = [
-            signal for message in self._parent.messages
-            for signal in message.signals
-            if self in message.senders
-        ]
-        return signals
+        """
+        Tuple of the signals in the messages this node sends.
+
+        The tuple is shared until the database is indexed again, use
+        ``list(node.tx_signals)`` for a copy that can be changed.
+        """
+        return self._get_signals(0, 'senders')
 
     @property
     def rx_signals(self):
-        signals = [
-            signal for message in self._parent.messages
-            for signal in message.signals
-            if self in message.receivers
-        ]
-        return signals
+        """
+        Tuple of the signals in the messages this node receives.
+
+        The tuple is shared until the database is indexed again, use
+        ``list(node.rx_signals)`` for a copy that can be changed.
+        """
+        return self._get_signals(1, 'receivers')
 
     @property
     def database(self):
@@ -115,19 +160,23 @@ class Node(attribute.AttributeMixin):
     def name(self, value):
         self._name = value
 
+        if self._parent is not None:
+            self._parent._refresh_nodes()
+
     @property
     def comment(self):
         """The node comment, or ``None`` if unavailable."""
-        if self._comment is not None and not isinstance(self._comment, NodeComment):
-            self._comment = NodeComment(self._comment)
-            self._comment.node = self
-
         return self._comment
 
     @comment.setter
     def comment(self, value):
-        if value is not None and not isinstance(value, (str, NodeComment)):
-            value = str(value)
+        # wrapped here so the getter has nothing left to check
+        if value is not None:
+            if not isinstance(value, NodeComment):
+                value = NodeComment(value)
+
+            if value.node is None:
+                value.node = self
 
         self._comment = value
 
@@ -139,10 +188,11 @@ class Node(attribute.AttributeMixin):
     @dbc.setter
     def dbc(self, value):
         self._dbc = value
+        self._tp_tx_cache = None
 
-    @property
-    def nm_station_address(self):
-        """
+    nm_station_address = attribute.HexAttributeProperty(
+        'NmStationAddress', 0, 2147483647,
+        doc="""
         Defines the NM address of the node.
 
         This address is used directly to compute the identifier of the associated Network Management message
@@ -154,140 +204,80 @@ class Node(attribute.AttributeMixin):
         NmStationAddress = 18, NmBaseAddress = 0x400
         => message ID = 0x412
         """
-        return self._get_attribute('NmStationAddress')
+    )
 
-    @nm_station_address.setter
-    def nm_station_address(self, value):
-        self._set_hex_attribute('NmStationAddress', 0, 2147483647, value)
+    nm_j1939_aac = attribute.IntAttributeProperty('NmJ1939AAC', 0, 1)
 
-    @property
-    def nm_j1939_aac(self):
-        return self._get_attribute('NmJ1939AAC')
+    nm_j1939_industry_group = attribute.IntAttributeProperty('NmJ1939IndustryGroup', 0, 7)
 
-    @nm_j1939_aac.setter
-    def nm_j1939_aac(self, value):
-        self._set_int_attribute('NmJ1939AAC', 0, 1, value)
+    nm_j1939_system = attribute.IntAttributeProperty('NmJ1939System', 0, 127)
 
-    @property
-    def nm_j1939_industry_group(self):
-        return self._get_attribute('NmJ1939IndustryGroup')
-
-    @nm_j1939_industry_group.setter
-    def nm_j1939_industry_group(self, value):
-        self._set_int_attribute('NmJ1939IndustryGroup', 0, 7, value)
-
-    @property
-    def nm_j1939_system(self):
-        return self._get_attribute('NmJ1939System')
-
-    @nm_j1939_system.setter
-    def nm_j1939_system(self, value):
-        self._set_int_attribute('NmJ1939System', 0, 127, value)
-
-    @property
-    def nm_j1939_system_instance(self):
-        return self._get_attribute('NmJ1939SystemInstance')
-
-    @nm_j1939_system_instance.setter
-    def nm_j1939_system_instance(self, value):
-        self._set_int_attribute('NmJ1939SystemInstance', 0, 15, value)
-
-    @property
-    def nm_j1939_function(self):
-        return self._get_attribute('NmJ1939Function')
-
-    @nm_j1939_function.setter
-    def nm_j1939_function(self, value):
-        self._set_int_attribute('NmJ1939Function', 0, 255, value)
-
-    @property
-    def nm_j1939_function_instance(self):
-        return self._get_attribute('NmJ1939FunctionInstance')
-
-    @nm_j1939_function_instance.setter
-    def nm_j1939_function_instance(self, value):
-        self._set_int_attribute('NmJ1939FunctionInstance', 0, 7, value)
-
-    @property
-    def nm_j1939_ecu_instance(self):
-        return self._get_attribute('NmJ1939ECUInstance')
+    nm_j1939_system_instance = attribute.IntAttributeProperty('NmJ1939SystemInstance', 0, 15)
 
-    @nm_j1939_ecu_instance.setter
-    def nm_j1939_ecu_instance(self, value):
-        self._set_int_attribute('NmJ1939ECUInstance', 0, 3, value)
+    nm_j1939_function = attribute.IntAttributeProperty('NmJ1939Function', 0, 255)
 
-    @property
-    def nm_j1939_manufacturer_code(self):
-        return self._get_attribute('NmJ1939ManufacturerCode')
+    nm_j1939_function_instance = attribute.IntAttributeProperty('NmJ1939FunctionInstance', 0, 7)
 
-    @nm_j1939_manufacturer_code.setter
-    def nm_j1939_manufacturer_code(self, value):
-        self._set_int_attribute('NmJ1939ManufacturerCode', 0, 2047, value)
+    nm_j1939_ecu_instance = attribute.IntAttributeProperty('NmJ1939ECUInstance', 0, 3)
 
-    @property
-    def nm_j1939_identity_number(self):
-        return self._get_attribute('NmJ1939IdentityNumber')
+    nm_j1939_manufacturer_code = attribute.IntAttributeProperty('NmJ1939ManufacturerCode', 0, 2047)
 
-    @nm_j1939_identity_number.setter
-    def nm_j1939_identity_number(self, value):
-        self._set_int_attribute('NmJ1939IdentityNumber', 0, 2097151, value)
+    nm_j1939_identity_number = attribute.IntAttributeProperty('NmJ1939IdentityNumber', 0, 2097151)
 
-    @property
-    def nm_can(self):
-        """
+    nm_can = attribute.IntAttributeProperty(
+        'NmCAN', 1, 2,
+        doc="""
         Specifies the CAN channel (1 or 2) on which the NM should send and receive.
 
         Note that this attribute is only taken into consideration in older versions of
         CANoe or if the "compatible" mode of a newer version is used.
         """
-        return self._get_attribute('NmCAN')
-
-    @nm_can.setter
-    def nm_can(self, value):
-        self._set_int_attribute('NmCAN', 1, 2, value)
+    )
 
-    @property
-    def gen_node_sleep_time(self):
-        """
+    gen_node_sleep_time = attribute.IntAttributeProperty(
+        'GenNodSleepTime', 0, 2147483647,
+        doc="""
         If the nodes have different wait times up to SleepRequest,
         set the time in this attribute in ms for each node.
 
         As soon as the attribute has a value>0, GenNWMSleepTime is not evaluated for this node.
         """
-        return self._get_attribute('GenNodSleepTime')
-
-    @gen_node_sleep_time.setter
-    def gen_node_sleep_time(self, value):
-        self._set_int_attribute('GenNodSleepTime', 0, 2147483647, value)
+    )
 
     @property
     def nm_node(self):
         """Defines whether the node participates in the network management or not."""
-        if 'NmNode' in self.dbc.attributes:
-            value = self.dbc.attributes['NmNode'].value
+        value = self._get_attribute('NmNode')
+        if value is not None:
             return bool(value)
 
     @nm_node.setter
     def nm_node(self, value):
         self._set_yes_no_attribute('NmNode', value)
 
-    @property
-    def tp_node_base_address(self):
-        """The base address that is used to determine the CAN ID for the TP messages (extended addressing mode only)."""
-        return self._get_attribute('TpNodeBaseAddress')
-
-    @tp_node_base_address.setter
-    def tp_node_base_address(self, value):
-        self._set_hex_attribute('TpNodeBaseAddress', 0x0, 0x7FF, value)
+    tp_node_base_address = attribute.HexAttributeProperty(
+        'TpNodeBaseAddress', 0x0, 0x7FF,
+        doc="""
+        The base address that is used to determine the CAN ID for the TP messages (extended addressing mode only).
+        """
+    )
 
     @property
     def tp_tx_indentfier(self):
         """Transmit ID for normal and 11 bit mixed addressing."""
-        return self._get_attribute('TpTxIdentifier')
+        cache = self._tp_tx_cache
+        if cache is None:
+            cache = self._tp_tx_cache = (self._get_attribute('TpTxIdentifier'),)
+
+        return cache[0]
 
     @tp_tx_indentfier.setter
     def tp_tx_indentfier(self, value):
         self._set_hex_attribute('TpTxIdentifier', 0x0, 0x7FFFFFF, value)
+        self._tp_tx_cache = None
+
+        if self._parent is not None:
+            self._parent._refresh_nodes()
 
     @property
     def tp_rx_indentfier(self):
@@ -298,70 +288,57 @@ class Node(attribute.AttributeMixin):
     def tp_rx_indentfier(self, value):
         self._set_hex_attribute('TpRxIdentifier', 0x0, 0x7FFFFFF, value)
 
-    @property
-    def tp_rx_mask(self):
-        """Identifies the receive message."""
-        return self._get_attribute('TpRxMask')
-
-    @tp_rx_mask.setter
-    def tp_rx_mask(self, value):
-        self._set_hex_attribute('TpRxMask', 0x0, 0x7FF, value)
-
-    @property
-    def tp_can_bus(self):
-        """Identifies the CAN channel used."""
-        return self._get_attribute('TpCanBus')
+        if self._parent is not None:
+            self._parent._refresh_nodes()
 
-    @tp_can_bus.setter
-    def tp_can_bus(self, value):
-        self._set_int_attribute('TpCanBus', 1, 2, value)
+    tp_rx_mask = attribute.HexAttributeProperty(
+        'TpRxMask', 0x0, 0x7FF,
+        doc="""
+        Identifies the receive message.
+        """
+    )
 
-    @property
-    def tp_tx_adr_mode(self):
+    tp_can_bus = attribute.IntAttributeProperty(
+        'TpCanBus', 1, 2,
+        doc="""
+        Identifies the CAN channel used.
         """
+    )
+
+    tp_tx_adr_mode = attribute.IntAttributeProperty(
+        'TpTxAdrMode', 0, 1,
+        doc="""
         Defines whether the node uses physical (0) or functional (1) addressing
         (for address modes normal fixed and mixed).
         """
-        return self._get_attribute('TpTxAdrMode')
-
-    @tp_tx_adr_mode.setter
-    def tp_tx_adr_mode(self, value):
-        self._set_int_attribute('TpTxAdrMode', 0, 1, value)
-
-    @property
-    def tp_address_extension(self):
-        """Sets the address extension used for (11 bit) mixed addressing mode."""
-        return self._get_attribute('TpAddressExtension')
-
-    @tp_address_extension.setter
-    def tp_address_extension(self, value):
-        self._set_int_attribute('TpAddressExtension', 0, 2147483647, value)
+    )
 
-    @property
-    def tp_st_min(self):
+    tp_address_extension = attribute.IntAttributeProperty(
+        'TpAddressExtension', 0, 2147483647,
+        doc="""
+        Sets the address extension used for (11 bit) mixed addressing mode.
         """
+    )
+
+    tp_st_min = attribute.IntAttributeProperty(
+        'TpSTMin', 0, 2147483647,
+        doc="""
         Minimum Separation Time required for this node.
 
         This is the minimum time the node shall wait between the transmissions of two consecutive frames.
         """
-        return self._get_attribute('TpSTMin')
-
-    @tp_st_min.setter
-    def tp_st_min(self, value):
-        self._set_int_attribute('TpSTMin', 0, 2147483647, value)
-
-    @property
-    def tp_block_size(self):
-        """Block size for this node."""
-        return self._get_attribute('TpBlockSize')
-
-    @tp_block_size.setter
-    def tp_block_size(self, value):
-        self._set_int_attribute('TpBlockSize', 0, 2147483647, value)
+    )
 
-    @property
-    def tp_addressing_mode(self):
+    tp_block_size = attribute.IntAttributeProperty(
+        'TpBlockSize', 0, 2147483647,
+        doc="""
+        Block size for this node.
         """
+    )
+
+    tp_addressing_mode = attribute.IntAttributeProperty(
+        'TpAddressingMode', 0, 4,
+        doc="""
         Defines the nodes addressing mode
 
         0 (normal addressing),
@@ -370,56 +347,40 @@ class Node(attribute.AttributeMixin):
         3 (mixed addressing),
         4 (11 bit mixed addressing)
         """
-        return self._get_attribute('TpAddressingMode')
-
-    @tp_addressing_mode.setter
-    def tp_addressing_mode(self, value):
-        self._set_int_attribute('TpAddressingMode', 0, 4, value)
-
-    @property
-    def tp_target_address(self):
-        """This attribute is relevant for extended addressing only. It specifies the nodes target address."""
-        return self._get_attribute('TpTargetAddress')
-
-    @tp_target_address.setter
-    def tp_target_address(self, value):
-        self._set_hex_attribute('TpTargetAddress', 0x0, 0xFF, value)
+    )
 
-    @property
-    def tp_use_fc(self):
+    tp_target_address = attribute.HexAttributeProperty(
+        'TpTargetAddress', 0x0, 0xFF,
+        doc="""
+        This attribute is relevant for extended addressing only. It specifies the nodes target address.
         """
+    )
+
+    tp_use_fc = attribute.IntAttributeProperty(
+        'TpUseFC', 0, 1,
+        doc="""
         Indicates whether flow control messages should be used (1) or not (0).
 
         The flow control mechanism allows the receiver to inform the sender about the receivers capabilities.
         """
-        return self._get_attribute('TpUseFC')
+    )
 
-    @tp_use_fc.setter
-    def tp_use_fc(self, value):
-        self._set_int_attribute('TpUseFC', 0, 1, value)
-
-    @property
-    def diag_station_address(self):
-        """Specifies the nodes diagnostic address."""
-        return self._get_attribute('DiagStationAddress')
-
-    @diag_station_address.setter
-    def diag_station_address(self, value):
-        self._set_hex_attribute('DiagStationAddress', 0x0, 0xFF, value)
-
-    @property
-    def node_layer_modules(self):
+    diag_station_address = attribute.HexAttributeProperty(
+        'DiagStationAddress', 0x0, 0xFF,
+        doc="""
+        Specifies the nodes diagnostic address.
         """
+    )
+
+    node_layer_modules = attribute.AttributeProperty(
+        'NodeLayerModules',
+        doc="""
         List of node layer DLLs loaded in CANoe.
 
         The node layer modules are separated in the string with a comma (",")
         e.g. "OSEK_TP.DLL, OSEKNM.DLL".
         """
-        return self._get_attribute('NodeLayerModules')
-
-    @node_layer_modules.setter
-    def node_layer_modules(self, value):
-        self._set_str_attribute('NodeLayerModules', value)
+    )
 
     @property
     def ecu(self):
@@ -442,141 +403,74 @@ class Node(attribute.AttributeMixin):
 
         self._set_str_attribute('ECU', value)
 
-    @property
-    def canoe_start_delay(self):
-        """
+        if self._parent is not None:
+            self._parent._refresh_nodes()
+
+    canoe_start_delay = attribute.IntAttributeProperty(
+        'CANoeStartDelay', 0, 2147483647,
+        doc="""
         Time span after the start of measurement
 
          Which the particular node remains completely passive.
          It does not react to external influences, nor does it activate itself.
          It does not change its behavior and function like every other node until the time span has elapsed.
-         """
-        return self._get_attribute('CANoeStartDelay')
-
-    @canoe_start_delay.setter
-    def canoe_start_delay(self, value):
-        self._set_int_attribute('CANoeStartDelay', 0, 2147483647, value)
-
-    @property
-    def canoe_drift(self):
-        """Percentage the timers used in the node are lengthened or shortened."""
-        return self._get_attribute('CANoeDrift')
-
-    @canoe_drift.setter
-    def canoe_drift(self, value):
-        self._set_int_attribute('CANoeDrift', 0, 2147483647, value)
+        """
+    )
 
-    @property
-    def canoe_jitter_min(self):
+    canoe_drift = attribute.IntAttributeProperty(
+        'CANoeDrift', 0, 2147483647,
+        doc="""
+        Percentage the timers used in the node are lengthened or shortened.
         """
+    )
+
+    canoe_jitter_min = attribute.IntAttributeProperty(
+        'CANoeJitterMin', 0, 2147483647,
+        doc="""
         With CANoeJitterMin and CANOeJitterMax the user specifies the interval within
         which the fluctuation of the timers of the node should lie. The fluctuation is
         uniformly distributed.
         """
-        return self._get_attribute('CANoeJitterMin')
+    )
 
-    @canoe_jitter_min.setter
-    def canoe_jitter_min(self, value):
-        self._set_int_attribute('CANoeJitterMin', 0, 2147483647, value)
-
-    @property
-    def canoe_jitter_max(self):
-        """
+    canoe_jitter_max = attribute.IntAttributeProperty(
+        'CANoeJitterMax', 0, 2147483647,
+        doc="""
         With CANoeJitterMin and CANOeJitterMax the user specifies the interval within
         which the fluctuation of the timers of the node should lie. The fluctuation is
         uniformly distributed.
         """
-        return self._get_attribute('CANoeJitterMax')
-
-    @canoe_jitter_max.setter
-    def canoe_jitter_max(self, value):
-        self._set_int_attribute('CANoeJitterMax', 0, 2147483647, value)
+    )
 
     @property
     def il_used(self):
         """Set to Yes if the node uses an interaction layer."""
-        if 'ILUsed' in self.dbc.attributes:
-            value = self.dbc.attributes['ILUsed'].value
+        value = self._get_attribute('ILUsed')
+        if value is not None:
             return bool(value)
 
     @il_used.setter
     def il_used(self, value):
-
-        if 'ILUsed' in self.dbc.attributes:
-            self.dbc.attributes['ILUsed'].value = value
-        else:
-
-            if 'ILUsed' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['ILUsed']
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    'ILUsed',
-                    default_value=0,
-                    kind='BU_',
-                    type_name='ENUM',
-                    choices={0: 'No', 1: 'Yes'}
-                )
-
-            self.dbc.attributes['ILUsed'] = attribute.Attribute(int(value), definition)
+        self._set_yes_no_attribute('ILUsed', value)
 
     @property
     def gen_nod_auto_gen_dsp(self):
-        if 'GenNodAutoGenDsp' in self.dbc.attributes:
-            value = self.dbc.attributes['GenNodAutoGenDsp'].value
+        value = self._get_attribute('GenNodAutoGenDsp')
+        if value is not None:
             return bool(value)
 
     @gen_nod_auto_gen_dsp.setter
     def gen_nod_auto_gen_dsp(self, value):
-        if 'GenNodAutoGenDsp' in self.dbc.attributes:
-            self.dbc.attributes['GenNodAutoGenDsp'].value = value
-        else:
-
-            if 'GenNodAutoGenDsp' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['GenNodAutoGenDsp']
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    'GenNodAutoGenDsp',
-                    default_value=0,
-                    kind='BU__',
-                    type_name='ENUM',
-                    choices={0: 'No', 1: 'Yes'}
-                )
-
-            self.dbc.attributes['GenNodAutoGenDsp'] = attribute.Attribute(int(value), definition)
+        self._set_yes_no_attribute('GenNodAutoGenDsp', value)
 
     @property
     def gen_nod_auto_gen_snd(self):
-        if 'GenNodAutoGenSnd' in self.dbc.attributes:
-            value = self.dbc.attributes['GenNodAutoGenSnd'].value
+        value = self._get_attribute('GenNodAutoGenSnd')
+        if value is not None:
             return bool(value)
 
     @gen_nod_auto_gen_snd.setter
     def gen_nod_auto_gen_snd(self, value):
+        self._set_yes_no_attribute('GenNodAutoGenSnd', value)
 
-        if 'GenNodAutoGenSnd' in self.dbc.attributes:
-            self.dbc.attributes['GenNodAutoGenSnd'].value = value
-        else:
-
-            if 'GenNodAutoGenSnd' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['GenNodAutoGenSnd']
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    'GenNodAutoGenSnd',
-                    default_value=0,
-                    kind='BU__',
-                    type_name='ENUM',
-                    choices={0: 'No', 1: 'Yes'}
-                )
-
-            self.dbc.attributes['GenNodAutoGenSnd'] = attribute.Attribute(int(value), definition)
-
-    @property
-    def gen_nod_nod_sleep_time(self):
-        return self._get_attribute('GenNodSleepTime')
-
-    @gen_nod_nod_sleep_time.setter
-    def gen_nod_nod_sleep_time(self, value):
-        self._set_int_attribute('GenNodSleepTime', 0, 2147483647, value)
+    gen_nod_nod_sleep_time = attribute.IntAttributeProperty('GenNodSleepTime', 0, 2147483647)
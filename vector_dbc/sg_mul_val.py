@@ -9,39 +9,63 @@ def _create_mux_ranges(multiplexer_ids):
         Output: [[1, 3], [5, 5], [7, 9]]
     """
     ordered = sorted(multiplexer_ids)
-    # Anything but ordered[0] - 1
-    prev_value = ordered[0]
+    start = previous = ordered[0]
     ranges = []
 
-    for value in ordered:
-        if value == prev_value + 1:
-            ranges[-1][1] = value
-        else:
-            ranges.append([value, value])
+    # a range is only stored once it ends, the values in between just
+    # move `previous` along
+    values = iter(ordered)
+    next(values)
 
-        prev_value = value
+    for value in values:
+        if value != previous + 1:
+            ranges.append([start, previous])
+            start = value
 
+        previous = value
+
+    ranges.append([start, previous])
     return ranges
 
 
+def _find_signal(message, name):
+    if message is None:
+        return None
+
+    try:
+        return message.get_signal_by_name(name)
+    except KeyError:
+        return None
+
+
 class SG_MUL_VAL(object):
+    __slots__ = (
+        '_parent',
+        '_multiplexer_signal',
+        '_multiplexer_ids',
+        '_multiplexer_id_set',
+        '_version',
+        '_ranges_cache'
+    )
 
     def __init__(self, parent, multiplexer_signal, multiplexer_ids):
         self._parent = parent
 
-        signal = [signal for signal in self._parent.message.signals if signal.name == self._multiplexer_signal]
-        if len(signal):
-            self._multiplexer_signal = signal[0]
-        else:
-            self._multiplexer_signal = multiplexer_signal
-
-        # for signal in self._parent.message.signals:
-        #     if signal.name == self._multiplexer_signal:
-        #         self._multiplexer_signal = signal
-        #         break
-        # else:
+        # the name is kept when the signal is not part of the message yet,
+        # the multiplexer_signal property resolves it later on
+        if isinstance(multiplexer_signal, str):
+            signal = _find_signal(parent.message, multiplexer_signal)
+            if signal is not None:
+                multiplexer_signal = signal
 
+        self._multiplexer_signal = multiplexer_signal
         self._multiplexer_ids = multiplexer_ids
+        # membership tests run for every signal while the codecs are built
+        self._multiplexer_id_set = set(multiplexer_ids)
+        # bumped on every change to the ids, __str__ keeps the rendered
+        # ranges as (version, text)
+        self._version = 0
+        self._ranges_cache = None
 
     def __radd__(self, other):
         if isinstance(other, tuple):
@@ -50,11 +74,13 @@ class SG_MUL_VAL(object):
             other = [other]
 
         for item in other:
-            if item not in self._multiplexer_ids:
-                self._multiplexer_ids += [item]
+            if item not in self._multiplexer_id_set:
+                self._multiplexer_id_set.add(item)
+                self._multiplexer_ids.append(item)
+                self._version += 1
 
     def __contains__(self, item):
-        return item in self._multiplexer_ids
+        return item in self._multiplexer_id_set
 
     def __iter__(self):
         return iter(self._multiplexer_ids)
@@ -70,6 +96,8 @@ class SG_MUL_VAL(object):
 
     def __setitem__(self, key, value):
         self._multiplexer_ids[key] = value
+        self._multiplexer_id_set = set(self._multiplexer_ids)
+        self._version += 1
 
     @property
     def multiplexer_signal(self):
@@ -79,10 +107,10 @@ class SG_MUL_VAL(object):
         if isinstance(self._multiplexer_signal, _signal.Signal):
             return self._multiplexer_signal
 
-        res = [signal for signal in self._parent.message.signals if signal.name == self._multiplexer_signal]
-        if len(res):
-            self._multiplexer_signal = res[0]
-            return res[0]
+        signal = _find_signal(self._parent.message, self._multiplexer_signal)
+        if signal is not None:
+            self._multiplexer_signal = signal
+            return signal
 
     @multiplexer_signal.setter
     def multiplexer_signal(self, value):
@@ -97,6 +125,8 @@ class SG_MUL_VAL(object):
         except KeyError:
             raise ValueError('signal not found')
 
+        self._multiplexer_signal = signal
+
     @property
     def is_ok(self):
         return self._multiplexer_signal is not None
@@ -105,6 +135,17 @@ class SG_MUL_VAL(object):
     def signal(self):
         return self._parent
 
+    def _get_ranges(self):
+        cache = self._ranges_cache
+        if cache is None or cache[0] != self._version:
+            ranges = ', '.join([
+                '%d-%d' % (minimum, maximum)
+                for minimum, maximum in _create_mux_ranges(self)
+            ])
+            cache = self._ranges_cache = (self._version, ranges)
+
+        return cache[1]
+
     def __str__(self):
         if not self.is_ok:
             return ''
@@ -113,10 +154,7 @@ class SG_MUL_VAL(object):
             frame_id=self._parent.message.dbc_frame_id,
             name=self._parent.name,
             multiplexer=self.multiplexer_signal.name,
-            ranges=', '.join(
-                '{}-{}'.format(minimum, maximum)
-                for minimum, maximum in _create_mux_ranges(self)
-            )
+            ranges=self._get_ranges()
         )
 
 
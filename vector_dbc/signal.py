@@ -21,12 +21,47 @@
 # SOFTWARE.
 
 from . import attribute
-from . import attribute_definition
 
 from .errors import EncodeError
 from .comment import SignalComment
 from . import sg_mul_val
 
+# shared by the enum definitions created by the setters in this module
+GEN_SIG_SEND_TYPE_CHOICES = {
+    0: 'Cyclic',
+    1: 'OnWrite',
+    2: 'OnWriteWithRepetition',
+    3: 'OnChange',
+    4: 'OnChangeWithRepetition',
+    5: 'IfActive',
+    6: 'IfActiveWithRepetition',
+    7: 'NoSigSendType'
+}
+
+SIG_TYPE_CHOICES = {
+    0: 'Default',
+    1: 'Range',
+    2: 'RangeSigned',
+    3: 'ASCII',
+    4: 'Discrete',
+    5: 'Control',
+    6: 'ReferencePGN',
+    7: 'DTC',
+    8: 'StringDelimiter',
+    9: 'StringLength',
+    10: 'StringLengthCtrl',
+    11: 'MessageCounter',
+    12: 'MessageChecksum'
+}
+
+GEN_SIG_ENV_VAR_TYPE_CHOICES = {
+    0: 'int',
+    1: 'float',
+    2: 'undef'
+}
+
+_SIGNAL_FMT = ' SG_ {0}{1} : {2}|{3}@{4}{5} ({6},{7}) [{8}|{9}] "{10}" {11}'
+
 
 class Decimal(object):
     """
@@ -39,47 +74,19 @@ class Decimal(object):
     precision (no rounding errors).
     """
 
-    def __init__(self, scale=None, offset=None, minimum=None, maximum=None):
-        self._scale = scale
-        self._offset = offset
-        self._minimum = minimum
-        self._maximum = maximum
-
-    @property
-    def scale(self):
-        """The scale factor of the signal value as ``decimal.Decimal``."""
-        return self._scale
+    # plain slots, the docstrings end up on the member descriptors
+    __slots__ = {
+        'scale': 'The scale factor of the signal value as ``decimal.Decimal``.',
+        'offset': 'The offset of the signal value as ``decimal.Decimal``.',
+        'minimum': 'The minimum value of the signal as ``decimal.Decimal``, or ``None`` if unavailable.',
+        'maximum': 'The maximum value of the signal as ``decimal.Decimal``, or ``None`` if unavailable.'
+    }
 
-    @scale.setter
-    def scale(self, value):
-        self._scale = value
-
-    @property
-    def offset(self):
-        """The offset of the signal value as ``decimal.Decimal``."""
-        return self._offset
-
-    @offset.setter
-    def offset(self, value):
-        self._offset = value
-
-    @property
-    def minimum(self):
-        """The minimum value of the signal as ``decimal.Decimal``, or ``None`` if unavailable."""
-        return self._minimum
-
-    @minimum.setter
-    def minimum(self, value):
-        self._minimum = value
-
-    @property
-    def maximum(self):
-        """The maximum value of the signal as ``decimal.Decimal``, or ``None`` if unavailable."""
-        return self._maximum
-
-    @maximum.setter
-    def maximum(self, value):
-        self._maximum = value
+    def __init__(self, scale=None, offset=None, minimum=None, maximum=None):
+        self.scale = scale
+        self.offset = offset
+        self.minimum = minimum
+        self.maximum = maximum
 
 
 class Signal(attribute.AttributeMixin):
@@ -119,6 +126,13 @@ class Signal(attribute.AttributeMixin):
     """
     _marker = 'SG_'
 
+    __slots__ = (
+        '_name', '_start', '_length', '_byte_order', '_is_signed', '_scale',
+        '_offset', '_minimum', '_maximum', '_decimal', '_unit', '_choices',
+        '_dbc', '_value', '_comments', '_receivers', '_receiver_names',
+        '_is_multiplexer', '_is_float', '_parent', '_multiplexer'
+    )
+
     def __init__(
         self, parent, name, start, length, byte_order='little_endian', is_signed=False,
         scale=1, offset=0, minimum=None, maximum=None, unit=None, choices=None, dbc_specifics=None,
@@ -146,26 +160,36 @@ class Signal(attribute.AttributeMixin):
         # argument, but it is quite convenient...
         if isinstance(comment, str):
             # use the first comment in the dictionary as "The" comment
-            self._comments = {None: comment}
+            self._comments = {None: self._wrap_comment(comment)}
         elif comment is None:
             self._comments = {}
         else:
             # multi-lingual dictionary
-            self._comments = comment
-
-        if not multiplexer_ids:
-            multiplexer_ids = []
+            self._comments = self._wrap_comments(comment)
 
         self._receivers = [] if receivers is None else receivers
+        self._receiver_names = frozenset(self._receivers)
         self._is_multiplexer = is_multiplexer
         self._is_float = is_float
         self._parent = parent
-        self._multiplexer = sg_mul_val.SG_MUL_VAL(self, multiplexer_signal, multiplexer_ids)
+
+        # most signals are not multiplexed, the SG_MUL_VAL object is only
+        # made for those when the multiplexer property is read
+        if multiplexer_signal is None and not multiplexer_ids:
+            self._multiplexer = None
+        else:
+            self._multiplexer = sg_mul_val.SG_MUL_VAL(
+                self, multiplexer_signal, multiplexer_ids or [])
 
     @property
     def message(self):
         return self._parent
 
+    def _structure_changed(self):
+        # the message only rebuilds its codecs on refresh when told to
+        if self._parent is not None:
+            self._parent._dirty = True
+
     @property
     def name(self):
         """The signal name as a string."""
@@ -174,6 +198,7 @@ class Signal(attribute.AttributeMixin):
     @name.setter
     def name(self, value):
         self._name = value
+        self._structure_changed()
 
     @property
     def start(self):
@@ -183,6 +208,7 @@ class Signal(attribute.AttributeMixin):
     @start.setter
     def start(self, value):
         self._start = value
+        self._structure_changed()
 
     @property
     def length(self):
@@ -192,6 +218,7 @@ class Signal(attribute.AttributeMixin):
     @length.setter
     def length(self, value):
         self._length = value
+        self._structure_changed()
 
     @property
     def byte_order(self):
@@ -201,6 +228,7 @@ class Signal(attribute.AttributeMixin):
     @byte_order.setter
     def byte_order(self, value):
         self._byte_order = value
+        self._structure_changed()
 
     @property
     def is_signed(self):
@@ -208,16 +236,17 @@ class Signal(attribute.AttributeMixin):
         ``True`` if the signal is signed, ``False`` otherwise. Ignore this
         attribute if :data:`~cantools.db.Signal.is_float` is ``True``.
         """
-        if self.is_float:
+        if self._is_float:
             return None
 
         return self._is_signed
 
     @is_signed.setter
     def is_signed(self, value):
-        if self.is_float:
+        if self._is_float:
             raise ValueError('This cannot be set when the signal data type is set to float')
         self._is_signed = value
+        self._structure_changed()
 
     @property
     def is_float(self):
@@ -227,6 +256,7 @@ class Signal(attribute.AttributeMixin):
     @is_float.setter
     def is_float(self, value):
         self._is_float = value
+        self._structure_changed()
 
     @property
     def scale(self):
@@ -311,20 +341,45 @@ class Signal(attribute.AttributeMixin):
         self._value = None
         return val
 
-    @property
-    def comments(self):
-        """The dictionary with the descriptions of the signal in multiple languages. ``None`` if unavailable."""
+    @staticmethod
+    def drain_values(signals):
+        """
+        Return the values of `signals` as a list and clear them, the same
+        as reading :attr:`value` of each signal in turn.
+        """
+        values = []
+        append = values.append
+
+        for signal in signals:
+            append(signal._value)
+            signal._value = None
 
-        for key, val in list(self._comments.items())[:]:
-            if val is not None:
-                if isinstance(val, bytes):
-                    val = val.decode('utf-8')
-                if not isinstance(val, SignalComment):
-                    val = SignalComment(val)
-                    val.signal = self
+        return values
 
-                self._comments[key] = val
+    def _wrap_comment(self, val):
+        if isinstance(val, SignalComment):
+            return val
 
+        if isinstance(val, bytes):
+            val = val.decode('utf-8')
+
+        val = SignalComment(val)
+        val.signal = self
+        return val
+
+    def _wrap_comments(self, comments):
+        # comments are decoded and wrapped when they are stored so the
+        # getters don't have to. the dict passed in belongs to the caller
+        # and is left as it is
+        wrap = self._wrap_comment
+        return {
+            key: val if val is None or type(val) is SignalComment else wrap(val)
+            for key, val in comments.items()
+        }
+
+    @property
+    def comments(self):
+        """The dictionary with the descriptions of the signal in multiple languages. ``None`` if unavailable."""
         return self._comments
 
     @comments.setter
@@ -335,16 +390,7 @@ class Signal(attribute.AttributeMixin):
         if not isinstance(value, dict):
             raise TypeError('passed value is not a dictionary `dict`')
 
-        for key, val in list(value.items())[:]:
-            if val is not None:
-                if isinstance(val, bytes):
-                    val = val.decode('utf-8')
-                if not isinstance(val, (str, SignalComment)):
-                    val = str(val)
-
-                value[key] = val
-
-        self._comments = value
+        self._comments = self._wrap_comments(value)
 
     @property
     def comment(self):
@@ -354,46 +400,36 @@ class Signal(attribute.AttributeMixin):
         Note that we implicitly try to return the comment's language
         to be English comment if multiple languages were specified.
         """
-        comment = self._comments.get(None, None)
-
-        if comment is None:
-            comment = self._comments.get('EN', None)
+        comments = self._comments
+        comment = comments.get(None, None)
 
-            if comment is not None:
-                if isinstance(comment, bytes):
-                    comment = comment.decode('utf-8')
+        # already wrapped, nothing else to do
+        if type(comment) is SignalComment:
+            return comment
 
-                if not isinstance(comment, SignalComment):
-                    comment = SignalComment(comment)
-                    comment.signal = self
-                    self._comments['EN'] = comment
+        if comment is None:
+            comment = comments.get('EN', None)
 
-        else:
-            if isinstance(comment, bytes):
-                comment = comment.decode('utf-8')
+            if comment is not None and type(comment) is not SignalComment:
+                comment = comments['EN'] = self._wrap_comment(comment)
 
-            if not isinstance(comment, SignalComment):
-                comment = SignalComment(comment)
-                comment.signal = self
-                self._comments[None] = comment
+            return comment
 
+        comment = comments[None] = self._wrap_comment(comment)
         return comment
 
     @comment.setter
     def comment(self, value):
-        if isinstance(value, bytes):
-            value = value.decode('utf-8')
-
-        if value is not None and not isinstance(value, (str, SignalComment)):
-            value = str(value)
+        if value is not None:
+            value = self._wrap_comment(value)
 
         self._comments = {None: value}
 
     @property
     def receivers(self):
         """A list of all receiver nodes of this signal."""
-        receivers = [node for node in self.message.database.nodes if node.name in self._receivers]
-        return receivers
+        receivers = self._receiver_names
+        return [node for node in self.message.database.nodes if node.name in receivers]
 
     @property
     def is_multiplexer(self):
@@ -403,12 +439,25 @@ class Signal(attribute.AttributeMixin):
     @is_multiplexer.setter
     def is_multiplexer(self, value):
         self._is_multiplexer = value
+        self._structure_changed()
 
     @property
     def multiplexer(self):
         """The multiplexer ids list if the signal is part of a multiplexed message, ``None`` otherwise."""
+        if self._multiplexer is None:
+            self._multiplexer = sg_mul_val.SG_MUL_VAL(self, None, [])
+
+        # the multiplexer ids can be changed through the returned object
+        self._structure_changed()
         return self._multiplexer
 
+    def _get_mux(self):
+        # the SG_MUL_VAL object when the signal is multiplexed, otherwise
+        # None. does not create the object or mark the message as changed
+        multiplexer = self._multiplexer
+        if multiplexer is not None and multiplexer.is_ok:
+            return multiplexer
+
     def choice_string_to_number(self, string):
         for choice_number, choice_string in self.choices.items():
             if choice_string == string:
@@ -428,21 +477,78 @@ class Signal(attribute.AttributeMixin):
 
         if self._parent is None:
             raise EncodeError('This signal is not attached to any database or message')
-        if data is None:
+
+        data = self._encode_data(data, {})
+        return self._parent.encode(data, scaling=scaling, padding=padding, strict=strict)
+
+    def _encode_data(self, value, data):
+        # adds the value of this signal and of its multiplexer to `data`
+        if value is None:
             if self.gen_sig_start_value is not None:
-                data = {self.name: self.gen_sig_start_value + self.offset}
+                value = self.gen_sig_start_value + self.offset
             else:
                 raise EncodeError(
                     "You must supply a signal value for signal {0}".format(self.name)
                 )
-        else:
-            data = {self.name: data}
 
-        if self.multiplexer.is_ok:
-            m_signal = self.multiplexer.multiplexer_signal
-            data[m_signal.name] = m_signal.choices[self.multiplexer[0]]
+        data[self.name] = value
 
-        return self._parent.encode(data, scaling=scaling, padding=padding, strict=strict)
+        multiplexer = self._get_mux()
+        if multiplexer is not None:
+            m_signal = multiplexer.multiplexer_signal
+            data[m_signal.name] = m_signal.choices[multiplexer[0]]
+
+        return data
+
+    @staticmethod
+    def encode_many(pairs, scaling=True, padding=False, strict=True):
+        """
+        Encode several signals with as few message encodes as possible.
+
+        `pairs` is an iterable of ``(signal, value)``, a value of ``None``
+        uses the initial value of the signal like :meth:`encode` does.
+        Signals of the same message end up in one frame unless they need
+        different multiplexer values, signals that are not multiplexed
+        are set in every frame of their message. Returns the encoded
+        frames grouped by message in the order the messages first appear
+        in `pairs`.
+        """
+        # id(message) -> [message, plain signal data, {mux key: data}]
+        messages = {}
+
+        for signal, value in pairs:
+            message = signal._parent
+            if message is None:
+                raise EncodeError('This signal is not attached to any database or message')
+
+            try:
+                entry = messages[id(message)]
+            except KeyError:
+                entry = messages[id(message)] = [message, {}, {}]
+
+            multiplexer = signal._get_mux()
+            if multiplexer is not None:
+                key = (multiplexer.multiplexer_signal.name, multiplexer[0])
+                data = entry[2].setdefault(key, {})
+            else:
+                data = entry[1]
+
+            signal._encode_data(value, data)
+
+        frames = []
+
+        for message, common, muxed in messages.values():
+            if not muxed:
+                muxed = {None: {}}
+
+            for data in muxed.values():
+                frame_data = dict(common)
+                frame_data.update(data)
+                frames.append(
+                    message.encode(frame_data, scaling=scaling, padding=padding, strict=strict)
+                )
+
+        return frames
 
     @property
     def gen_sig_send_type(self):
@@ -453,42 +559,15 @@ class Signal(attribute.AttributeMixin):
         send types of the other signals placed on the message define the overall
         transmit behavior of the message.
         """
-        value = self._get_attribute('GenSigSendType')
-        if value is not None:
-            return self.dbc.attributes['GenSigSendType'].definition.choices[value]
+        return self._get_enum_attribute('GenSigSendType')
 
     @gen_sig_send_type.setter
     def gen_sig_send_type(self, value):
-        if 'GenSigSendType' in self.dbc.attributes:
-            self.dbc.attributes['GenSigSendType'].value = value
-        else:
-            if 'GenSigSendType' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['GenSigSendType']
-            else:
-                definition = attribute_definition.AttributeDefinition(
-                    'GenSigSendType',
-                    default_value=0,
-                    kind='SG_',
-                    type_name='ENUM',
-                    choices={
-                        0: 'Cyclic',
-                        1: 'OnWrite',
-                        2: 'OnWriteWithRepetition',
-                        3: 'OnChange',
-                        4: 'OnChangeWithRepetition',
-                        5: 'IfActive',
-                        6: 'IfActiveWithRepetition',
-                        7: 'NoSigSendType'
-                    }
-                )
+        self._set_enum_attribute('GenSigSendType', GEN_SIG_SEND_TYPE_CHOICES, value)
 
-            choices = {v: k for k, v in definition.choices.items()}
-
-            self.dbc.attributes['GenSigSendType'] = attribute.Attribute(choices[value], definition)
-
-    @property
-    def gen_sig_inactive_value(self):
-        """
+    gen_sig_inactive_value = attribute.IntAttributeProperty(
+        'GenSigInactiveValue', 0, 2147483647,
+        doc="""
         Defines the inactive value of a signal.
 
         This value is only used for signal send type IfActive. If the signal
@@ -496,30 +575,22 @@ class Signal(attribute.AttributeMixin):
         on will be transmitted periodically with a periodicity of GenMsgCycleTimeFast.
         The signals inactive value is given as a signals raw value in this attribute.
         """
-        return self._get_attribute('GenSigInactiveValue')
+    )
 
-    @gen_sig_inactive_value.setter
-    def gen_sig_inactive_value(self, value):
-        self._set_int_attribute('GenSigInactiveValue', 0, 2147483647, value)
-
-    @property
-    def gen_sig_start_value(self):
-        """
+    gen_sig_start_value = attribute.IntAttributeProperty(
+        'GenSigStartValue', 0, 2147483647,
+        doc="""
         Defines the start or initial value of the signal.
 
         This value is send after system start-up until the application
         sets the signal value the first time. The signals start value is
         given as a signals raw value in this attribute.
         """
-        return self._get_attribute('GenSigStartValue')
+    )
 
-    @gen_sig_start_value.setter
-    def gen_sig_start_value(self, value):
-        self._set_int_attribute('GenSigStartValue', 0, 2147483647, value)
-
-    @property
-    def gen_sig_timeout_time(self):
-        """
+    gen_sig_timeout_time = attribute.IntAttributeProperty(
+        'GenSigTimeoutTime', 0, 2147483647,
+        doc="""
         Defines the time of the signal receive timeout.
 
         If the message of the signal isn't received for this time interval a
@@ -528,15 +599,11 @@ class Signal(attribute.AttributeMixin):
         name of the receiving ECU if the attribute is defined for signals
         instead of Node-mapped Tx-Signal relations.
         """
-        return self._get_attribute('GenSigTimeoutTime')
-
-    @gen_sig_timeout_time.setter
-    def gen_sig_timeout_time(self, value):
-        self._set_int_attribute('GenSigTimeoutTime', 0, 2147483647, value)
+    )
 
-    @property
-    def gen_sig_timeout_msg(self):
-        """
+    gen_sig_timeout_msg = attribute.HexAttributeProperty(
+        'GenSigTimeoutMsg', 0x0, 0x7FF,
+        doc="""
         Defines the ID of the message the signal is supervised by.
 
         If the message with the given ID is received by the receiver node, no
@@ -545,22 +612,14 @@ class Signal(attribute.AttributeMixin):
         receiving ECU if the attribute is defined for signals instead of
         Node-mapped Tx-Signal relations.
         """
-        return self._get_attribute('GenSigTimeoutMsg')
+    )
 
-    @gen_sig_timeout_msg.setter
-    def gen_sig_timeout_msg(self, value):
-        self._set_hex_attribute('GenSigTimeoutMsg', 0x0, 0x7FF, value)
-
-    @property
-    def nwm_wakeup_allowed(self):
-        """
+    nwm_wakeup_allowed = attribute.YesNoAttributeProperty(
+        'NWM-WakeupAllowed',
+        doc="""
         This attribute is set to No for signals that have no effect on the NM.
         """
-        return bool(self._get_attribute('NWM-WakeupAllowed'))
-
-    @nwm_wakeup_allowed.setter
-    def nwm_wakeup_allowed(self, value):
-        self._set_yes_no_attribute('NWM-WakeupAllowed', value)
+    )
 
     @property
     def sig_type(self):
@@ -642,211 +701,78 @@ class Signal(attribute.AttributeMixin):
             MessageCounter:
             MessageChecksum:
         """
-        if 'SigType' in self.dbc.attributes:
-            value = self.dbc.attributes['SigType'].value
-            return self.dbc.attributes['SigType'].definition.choices[value]
+        return self._get_enum_attribute('SigType')
 
     @sig_type.setter
     def sig_type(self, value):
-        if 'SigType' in self.dbc.attributes:
-            self.dbc.attributes['SigType'].value = value
-        else:
-
-            if 'SigType' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['SigType']
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    'SigType',
-                    default_value=0,
-                    kind='SG_',
-                    type_name='ENUM',
-                    choices={
-                        0: 'Default',
-                        1: 'Range',
-                        2: 'RangeSigned',
-                        3: 'ASCII',
-                        4: 'Discrete',
-                        5: 'Control',
-                        6: 'ReferencePGN',
-                        7: 'DTC',
-                        8: 'StringDelimiter',
-                        9: 'StringLength',
-                        10: 'StringLengthCtrl',
-                        11: 'MessageCounter',
-                        12: 'MessageChecksum'
-                    }
-                )
+        self._set_enum_attribute('SigType', SIG_TYPE_CHOICES, value)
 
-            choices = {v: k for k, v in definition.choices.items()}
-
-            self.dbc.attributes['SigType'] = attribute.Attribute(choices[value], definition)
-
-    @property
-    def spn(self):
-        """
+    spn = attribute.IntAttributeProperty(
+        'SPN', 0, 524287,
+        doc="""
         With the attribute SPN, the Suspect Parameter Number is defined
 
         The SPN is specified in the J1939 specification. This attribute is used,
         for example, by the J1939 DTC Monitor.
         """
-        return self._get_attribute('SPN')
-
-    @spn.setter
-    def spn(self, value):
-        self._set_int_attribute('SPN', 0, 524287, value)
-
-    @property
-    def gen_sig_alt_setting(self):
-        return self._get_attribute('GenSigAltSetting')
-
-    @gen_sig_alt_setting.setter
-    def gen_sig_alt_setting(self, value):
-        self._set_str_attribute('GenSigAltSetting', value)
-
-    @property
-    def gen_sig_assign_setting(self):
-        return self._get_attribute('GenSigAssignSetting')
-
-    @gen_sig_assign_setting.setter
-    def gen_sig_assign_setting(self, value):
-        self._set_str_attribute('GenSigAssignSetting', value)
-
-    @property
-    def gen_sig_conditional_send(self):
-        return self._get_attribute('GenSigConditionalSend')
-
-    @gen_sig_conditional_send.setter
-    def gen_sig_conditional_send(self, value):
-        self._set_str_attribute('GenSigConditionalSend', value)
-
-    @property
-    def gen_sig_ev_name(self):
-        return self._get_attribute('GenSigEVName')
-
-    @gen_sig_ev_name.setter
-    def gen_sig_ev_name(self, value):
-        self._set_str_attribute('GenSigEVName', value)
-
-    @property
-    def gen_sig_post_if_setting(self):
-        return self._get_attribute('GenSigPostIfSetting')
+    )
 
-    @gen_sig_post_if_setting.setter
-    def gen_sig_post_if_setting(self, value):
-        self._set_str_attribute('GenSigPostIfSetting', value)
+    gen_sig_alt_setting = attribute.AttributeProperty('GenSigAltSetting')
 
-    @property
-    def gen_sig_post_setting(self):
-        return self._get_attribute('GenSigPostSetting')
+    gen_sig_assign_setting = attribute.AttributeProperty('GenSigAssignSetting')
 
-    @gen_sig_post_setting.setter
-    def gen_sig_post_setting(self, value):
-        self._set_str_attribute('GenSigPostSetting', value)
+    gen_sig_conditional_send = attribute.AttributeProperty('GenSigConditionalSend')
 
-    @property
-    def gen_sig_pre_if_setting(self):
-        return self._get_attribute('GenSigPreIfSetting')
+    gen_sig_ev_name = attribute.AttributeProperty('GenSigEVName')
 
-    @gen_sig_pre_if_setting.setter
-    def gen_sig_pre_if_setting(self, value):
-        self._set_str_attribute('GenSigPreIfSetting', value)
+    gen_sig_post_if_setting = attribute.AttributeProperty('GenSigPostIfSetting')
 
-    @property
-    def gen_sig_pre_setting(self):
-        return self._get_attribute('GenSigPreSetting')
+    gen_sig_post_setting = attribute.AttributeProperty('GenSigPostSetting')
 
-    @gen_sig_pre_setting.setter
-    def gen_sig_pre_setting(self, value):
-        self._set_str_attribute('GenSigPreSetting', value)
+    gen_sig_pre_if_setting = attribute.AttributeProperty('GenSigPreIfSetting')
 
-    @property
-    def gen_sig_receive_setting(self):
-        return self._get_attribute('GenSigReceiveSetting')
+    gen_sig_pre_setting = attribute.AttributeProperty('GenSigPreSetting')
 
-    @gen_sig_receive_setting.setter
-    def gen_sig_receive_setting(self, value):
-        self._set_str_attribute('GenSigReceiveSetting', value)
+    gen_sig_receive_setting = attribute.AttributeProperty('GenSigReceiveSetting')
 
-    @property
-    def gen_sig_auto_gen_dsp(self):
-        return bool(self._get_attribute('GenSigAutoGenDsp'))
-
-    @gen_sig_auto_gen_dsp.setter
-    def gen_sig_auto_gen_dsp(self, value):
-        self._set_yes_no_attribute('GenSigAutoGenDsp', value)
-
-    @property
-    def gen_sig_auto_gen_snd(self):
-        return bool(self._get_attribute('GenSigAutoGenSnd'))
+    gen_sig_auto_gen_dsp = attribute.YesNoAttributeProperty('GenSigAutoGenDsp')
 
-    @gen_sig_auto_gen_snd.setter
-    def gen_sig_auto_gen_snd(self, value):
-        self._set_yes_no_attribute('GenSigAutoGenSnd', value)
+    gen_sig_auto_gen_snd = attribute.YesNoAttributeProperty('GenSigAutoGenSnd')
 
     @property
     def gen_sig_env_var_type(self):
-        if 'GenSigEnvVarType' in self.dbc.attributes:
-            value = self.dbc.attributes['GenSigEnvVarType'].value
-            return self.dbc.attributes['GenSigEnvVarType'].definition.choices[value]
+        return self._get_enum_attribute('GenSigEnvVarType')
 
     @gen_sig_env_var_type.setter
     def gen_sig_env_var_type(self, value):
-        if 'GenSigEnvVarType' in self.dbc.attributes:
-            self.dbc.attributes['GenSigEnvVarType'].value = value
-        else:
-
-            if 'GenSigEnvVarType' in self.dbc.attribute_definitions:
-                definition = self.dbc.attribute_definitions['GenSigEnvVarType']
-            else:
-
-                definition = attribute_definition.AttributeDefinition(
-                    'GenSigEnvVarType',
-                    default_value=2,
-                    kind='SG_',
-                    type_name='ENUM',
-                    choices={
-                        0: 'int',
-                        1: 'float',
-                        2: 'undef'
-                    }
-                )
-
-            choices = {v: k for k, v in definition.choices.items()}
-
-            self.dbc.attributes['GenSigEnvVarType'] = attribute.Attribute(choices[value], definition)
+        self._set_enum_attribute('GenSigEnvVarType', GEN_SIG_ENV_VAR_TYPE_CHOICES, value, default_value=2)
 
     def __str__(self):
-        if self.is_multiplexer:
+        if self._is_multiplexer:
             mux = ' M'
-        elif self.multiplexer.is_ok:
-            mux = ' m{}'.format(self.multiplexer[0])
+        elif self._get_mux() is not None:
+            mux = ' m{}'.format(self._multiplexer[0])
         else:
             mux = ''
 
-        if self.receivers:
-            receivers = ' ' + ','.join(node.name for node in self.receivers)
+        # the property walks every node of the database, only do it once
+        receivers = self.receivers
+        if receivers:
+            receivers = ' ' + ','.join(node.name for node in receivers)
         else:
             receivers = 'Vector__XXX'
 
-        fmt = (
-            ' SG_ {name}{mux} : {start}|{length}@{byte_order}{sign}'
-            ' ({scale},{offset})'
-            ' [{minimum}|{maximum}] "{unit}" {receivers}'
-        )
-
-        res = fmt.format(
-                name=self.name,
-                mux=mux,
-                start=self.start,
-                length=self.length,
-                receivers=receivers,
-                byte_order=(0 if self.byte_order == 'big_endian' else 1),
-                sign='-' if self.is_signed else '+',
-                scale=self.scale,
-                offset=self.offset,
-                minimum=0 if self.minimum is None else self.minimum,
-                maximum=0 if self.maximum is None else self.maximum,
-                unit='' if self.unit is None else self.unit
+        return _SIGNAL_FMT.format(
+            self._name,
+            mux,
+            self._start,
+            self._length,
+            0 if self._byte_order == 'big_endian' else 1,
+            '-' if self._is_signed and not self._is_float else '+',
+            self._scale,
+            self._offset,
+            0 if self._minimum is None else self._minimum,
+            0 if self._maximum is None else self._maximum,
+            '' if self._unit is None else self._unit,
+            receivers
         )
-        return res
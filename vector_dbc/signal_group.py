@@ -28,6 +28,8 @@ class SignalGroup(object):
     group have to be updated in common.
     """
 
+    __slots__ = ('_name', '_repetitions', '_signal_names', '_parent')
+
     def __init__(self, parent, name, repetitions=1, signal_names=None):
         self._name = name
         self._repetitions = repetitions
@@ -59,26 +61,30 @@ class SignalGroup(object):
     @property
     def signals(self):
         """The signals in this group"""
-        return [signal for signal in self._parent.signals if signal.name in self._signal_names]
+        signal_names = set(self._signal_names)
+        return [signal for signal in self._parent._signals if signal.name in signal_names]
 
     @signals.setter
     def signals(self, value):
         sig_names = []
+        seen = set()
 
         for signal in value:
             if signal.message != self._parent:
                 raise ValueError('signal must be mapped to the message of this signal group')
 
-            if signal.name not in sig_names:
-                sig_names += [signal.name]
+            if signal.name not in seen:
+                seen.add(signal.name)
+                sig_names.append(signal.name)
 
-        self._signal_names = sig_names[:]
+        self._signal_names = sig_names
 
     def __str__(self):
-        all_sig_names = list(map(lambda sig: sig.name, self._parent.signals))
-        self._signal_names = list(filter(
-            lambda sig_name: sig_name in all_sig_names, self._signal_names
-        ))
+        all_sig_names = {sig.name for sig in self._parent._signals}
+        self._signal_names = [
+            sig_name for sig_name in self._signal_names
+            if sig_name in all_sig_names
+        ]
 
         return 'SIG_GROUP_ {frame_id} {signal_group_name} {repetitions} : {signal_names};'.format(
             frame_id=self._parent.dbc_frame_id,
@@ -1,189 +1,250 @@
 
 from decimal import Decimal
 
+# the factors are parsed once instead of on every call
+_D_0_145038 = Decimal('0.145038')
+_D_0_01 = Decimal('0.01')
+_D_1000_0 = Decimal('1000.0')
+_D_14_5038 = Decimal('14.5038')
+_D_100_0 = Decimal('100.0')
+_D_100000_0 = Decimal('100000.0')
+_D_6_89476 = Decimal('6.89476')
+_D_0_0689476 = Decimal('0.0689476')
+_D_6894_76 = Decimal('6894.76')
+_D_0_000145038 = Decimal('0.000145038')
+_D_0_001 = Decimal('0.001')
+_D_1eM5 = Decimal('1e-5')
+_D_0_621371 = Decimal('0.621371')
+_D_0_911344 = Decimal('0.911344')
+_D_0_277778 = Decimal('0.277778')
+_D_1_60934 = Decimal('1.60934')
+_D_1_46667 = Decimal('1.46667')
+_D_0_44704 = Decimal('0.44704')
+_D_0_681818 = Decimal('0.681818')
+_D_1_09728 = Decimal('1.09728')
+_D_0_3048 = Decimal('0.3048')
+_D_3_6 = Decimal('3.6')
+_D_2_23694 = Decimal('2.23694')
+_D_3_28084 = Decimal('3.28084')
+_D_1_8 = Decimal('1.8')
+_D_9_0 = Decimal('9.0')
+_D_5_0 = Decimal('5.0')
+_D_32_0 = Decimal('32.0')
+_D_0_26 = Decimal('0.26')
+_D_3_78541178 = Decimal('3.78541178')
+_D_0_132277 = Decimal('0.132277')
+_D_7_5599 = Decimal('7.5599')
+_D_240 = Decimal('240')
+_D_29_92 = Decimal('29.92')
+
 
 # --- Force
 def kpa_to_psi(value):
     """Kilopascal to Pound-force per square inch"""
-    return float(Decimal(str(value)) * Decimal('0.145038'))
+    return float(Decimal(str(value)) * _D_0_145038)
 
 
 def kpa_to_bar(value):
     """Kilopascal to Bar"""
-    return float(Decimal(str(value)) * Decimal('0.01'))
+    return float(Decimal(str(value)) * _D_0_01)
 
 
 def kpa_to_pa(value):
     """Kilopascal to Pascal"""
-    return float(Decimal(str(value)) * Decimal('1000.0'))
+    return float(Decimal(str(value)) * _D_1000_0)
 
 
 def bar_to_psi(value):
     """Bar to Pound-force per square inch"""
-    return float(Decimal(str(value)) * Decimal('14.5038'))
+    return float(Decimal(str(value)) * _D_14_5038)
 
 
 def bar_to_kpa(value):
     """Bar to Kilopascal"""
-    return float(Decimal(str(value)) * Decimal('100.0'))
+    return float(Decimal(str(value)) * _D_100_0)
 
 
 def bar_to_pa(value):
     """Bar to Pascal"""
-    return float(Decimal(str(value)) * Decimal('100000.0'))
+    return float(Decimal(str(value)) * _D_100000_0)
 
 
 def psi_to_kpa(value):
     """Pound-force per square inch to Kilopascal"""
-    return float(Decimal(str(value)) * Decimal('6.89476'))
+    return float(Decimal(str(value)) * _D_6_89476)
 
 
 def psi_to_bar(value):
     """Pound-force per square inch to Bar"""
-    return float(Decimal(str(value)) * Decimal('0.0689476'))
+    return float(Decimal(str(value)) * _D_0_0689476)
 
 
 def psi_to_pa(value):
     """Pound-force per square inch to Pascal"""
-    return float(Decimal(str(value)) * Decimal('6894.76'))
+    return float(Decimal(str(value)) * _D_6894_76)
 
 
 def pa_to_psi(value):
     """Pascal to Pound-force per square inch"""
-    return float(Decimal(str(value)) * Decimal('0.000145038'))
+    return float(Decimal(str(value)) * _D_0_000145038)
 
 
 def pa_to_kpa(value):
     """Pascal to Kilopascal"""
-    return float(Decimal(str(value)) * Decimal('0.001'))
+    return float(Decimal(str(value)) * _D_0_001)
 
 
 def pa_to_bar(value):
     """Pascal to Bar"""
-    return float(Decimal(str(value)) * Decimal('1e-5'))
+    return float(Decimal(str(value)) * _D_1eM5)
 
 
 # --- Speed
 def kph_to_mph(value):
     """Kilometer per hour to Mile per hour"""
-    return float(Decimal(str(value)) * Decimal('0.621371'))
+    return float(Decimal(str(value)) * _D_0_621371)
 
 
 def kph_to_ftsec(value):
     """Kilometer per hour to Foot per second"""
-    return float(Decimal(str(value)) * Decimal('0.911344'))
+    return float(Decimal(str(value)) * _D_0_911344)
 
 
 def kph_to_msec(value):
     """Kilometer per hour to Meter per second"""
-    return float(Decimal(str(value)) * Decimal('0.277778'))
+    return float(Decimal(str(value)) * _D_0_277778)
 
 
 def mph_to_kph(value):
     """Mile per hour to Kilometer per hour"""
-    return float(Decimal(str(value)) * Decimal('1.60934'))
+    return float(Decimal(str(value)) * _D_1_60934)
 
 
 def mph_to_ftsec(value):
     """Mile per hour to Foot per second"""
-    return float(Decimal(str(value)) * Decimal('1.46667'))
+    return float(Decimal(str(value)) * _D_1_46667)
 
 
 def mph_to_msec(value):
     """Mile per hour to Meter per second"""
-    return float(Decimal(str(value)) * Decimal('0.44704'))
+    return float(Decimal(str(value)) * _D_0_44704)
 
 
 def ftsec_to_mph(value):
     """Foot per second to Mile per hour"""
-    return float(Decimal(str(value)) * Decimal('0.681818'))
+    return float(Decimal(str(value)) * _D_0_681818)
 
 
 def ftsec_to_kph(value):
     """Foot per second to Kilometer per hour"""
-    return float(Decimal(str(value)) * Decimal('1.09728'))
+    return float(Decimal(str(value)) * _D_1_09728)
 
 
 def ftsec_to_msec(value):
     """Foot per second to Meter per second"""
-    return float(Decimal(str(value)) * Decimal('0.3048'))
+    return float(Decimal(str(value)) * _D_0_3048)
 
 
 def msec_to_kph(value):
     """Meter per second to Kilometer per hour"""
-    return float(Decimal(str(value)) * Decimal('3.6'))
+    return float(Decimal(str(value)) * _D_3_6)
 
 
 def msec_to_mph(value):
     """Meter per second to Mile per hour"""
-    return float(Decimal(str(value)) * Decimal('2.23694'))
+    return float(Decimal(str(value)) * _D_2_23694)
 
 
 def msec_to_ftsec(value):
     """Meter per second to Foot per second"""
-    return float(Decimal(str(value)) * Decimal('3.28084'))
+    return float(Decimal(str(value)) * _D_3_28084)
 
 
 # --- Temperature
 def c_to_f(value):
     """Celcius to Farenheit"""
-    return float((Decimal(str(value)) * Decimal('9.0') / Decimal('5.0')) + Decimal('32.0'))
+    return float(Decimal(str(value)) * _D_1_8 + _D_32_0)
 
 
 def f_to_c(value):
     """Farenheit to Celcius"""
-    return float((Decimal(str(value)) - Decimal('32.0')) * Decimal('5.0') / Decimal('9.0'))
+    return float((Decimal(str(value)) - _D_32_0) * _D_5_0 / _D_9_0)
 
 
 # --- Volume
 def lh_to_gh(value):
     """Liter per hour to Gallon per hour"""
-    return float(Decimal(str(value)) * Decimal('0.26'))
+    return float(Decimal(str(value)) * _D_0_26)
 
 
 def gh_to_lh(value):
     """Gallon per hour to Liter per hour"""
-    return float(Decimal(str(value)) * Decimal('3.78541178'))
+    return float(Decimal(str(value)) * _D_3_78541178)
 
 
 # --- Weight
 def gsec_to_lbm(value):
     """Gram per second to Pound a minute"""
-    return float(Decimal(str(value)) * Decimal('0.132277'))
+    return float(Decimal(str(value)) * _D_0_132277)
 
 
 def lbm_to_gsec(value):
     """Pound a minute to Gram per second"""
-    return float(Decimal(str(value)) * Decimal('7.5599'))
+    return float(Decimal(str(value)) * _D_7_5599)
 
 
 # Volume & Weight
 def gsec_to_cfm(value):
     """Gram per second to Cubic foot a minute"""
-    return float((Decimal(str(value)) * Decimal('4') * Decimal('60')) / Decimal('29.92'))
+    return float(Decimal(str(value)) * _D_240 / _D_29_92)
 
 
 def cfm_to_gsec(value):
     """Cubic foot a minute to Gram per second"""
-    return float(((Decimal(str(value)) * Decimal('29.92')) / Decimal('60.0')) / Decimal('4.0'))
+    return float(Decimal(str(value)) * _D_29_92 / _D_240)
 
 
 def cfm_to_lbm(value):
     """Cubic foot a minute to Pound a minute"""
-    return gsec_to_lbm(cfm_to_gsec(value))
+    return float(Decimal(str(value)) * _D_29_92 / _D_240 * _D_0_132277)
 
 
 def lbm_to_cfm(value):
     """Pound a minute to Cubic foot a minute"""
-    return gsec_to_cfm(lbm_to_gsec(value))
+    return float(Decimal(str(value)) * _D_7_5599 * _D_240 / _D_29_92)
 
 
 # --- Distance
 def km_to_mi(value):
     """Kilometer to Mile"""
-    return float(Decimal(str(value)) * Decimal('0.621371'))
+    return float(Decimal(str(value)) * _D_0_621371)
 
 
 def mi_to_km(value):
     """Mile to Kilometer"""
-    return float(Decimal(str(value)) * Decimal('1.60934'))
+    return float(Decimal(str(value)) * _D_1_60934)
+
+
+# (from unit, to unit) -> conversion function, built from the names above
+CONVERSIONS = {
+    tuple(name.split('_to_')): func
+    for name, func in list(globals().items())
+    if '_to_' in name and callable(func)
+}
+
+
+def convert(value, from_unit, to_unit):
+    """
+    Convert `value` using the unit names of the functions in this module,
+    e.g. ``convert(10, 'kph', 'mph')``.
+
+    When converting a lot of values look the function up in
+    :data:`CONVERSIONS` once instead.
+    """
+    try:
+        func = CONVERSIONS[(from_unit, to_unit)]
+    except KeyError:
+        raise ValueError(
+            'No conversion from "{0}" to "{1}".'.format(from_unit, to_unit))
+
+    return func(value)
@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import binascii
+import functools
 from decimal import Decimal
 from collections import namedtuple
 
@@ -56,22 +56,63 @@ def format_and(items):
             ', '.join(items[:-1]), items[-1])
 
 
+# the fields are Signal objects, the functions below run for every frame
+# so they read the signal slots instead of going through the properties
+
 def start_bit(data):
-    if data.byte_order == 'big_endian':
-        return 8 * (data.start // 8) + (7 - (data.start % 8))
+    start = data._start
+    if data._byte_order == 'big_endian':
+        return 8 * (start // 8) + (7 - (start % 8))
     else:
-        return data.start
+        return start
 
 
 def _encode_field(field, data, scaling):
-    value = data[field.name]
+    value = data[field._name]
 
     if isinstance(value, str):
         return field.choice_string_to_number(value)
     elif scaling:
-        value = (Decimal(value) - Decimal(field.offset)) / Decimal(field.scale)
-
-        if field.is_float:
+        scale = field._scale
+        offset = field._offset
+
+        # most signals have an integer scale and offset, the raw value
+        # is then worked out with ints, rounding half to even like
+        # Decimal.to_integral() does
+        if (
+            type(value) is int and
+            type(scale) is int and
+            type(offset) is int and
+            scale > 0 and
+            not field._is_float
+        ):
+            value, remainder = divmod(value - offset, scale)
+            remainder *= 2
+
+            if remainder > scale or (remainder == scale and value & 1):
+                value += 1
+
+            return value
+
+        # float math is close enough to pick the same integer as Decimal
+        # unless the quotient sits right at a .5 rounding point, only
+        # then is the exact Decimal result needed
+        if (type(value) is float or type(value) is int) and not field._is_float:
+            try:
+                float_scale = float(scale)
+                float_offset = float(offset)
+                quotient = (value - float_offset) / float_scale
+                tolerance = 1e-9 * ((abs(value) + abs(float_offset)) / abs(float_scale) + 1.0)
+            except (ZeroDivisionError, OverflowError):
+                pass
+            else:
+                # NaN and infinity fail the test and go the Decimal way
+                if abs(quotient % 1.0 - 0.5) > tolerance:
+                    return round(quotient)
+
+        value = (Decimal(value) - Decimal(offset)) / Decimal(scale)
+
+        if field._is_float:
             return float(value)
         else:
             return int(value.to_integral())
@@ -79,57 +120,100 @@ def _encode_field(field, data, scaling):
         return value
 
 
-def _decode_field(field, value, decode_choices, scaling):
-    if decode_choices:
-        try:
-            return field.choices[value]
-        except (KeyError, TypeError):
-            pass
-
-    if scaling:
-        return field.scale * value + field.offset
-    else:
-        return value
-
-
 def encode_data(data, fields, formats, scaling):
     if len(fields) == 0:
         return 0
 
     unpacked = {
-        field.name: _encode_field(field, data, scaling)
+        field._name: _encode_field(field, data, scaling)
         for field in fields
     }
-    big_packed = formats.big_endian.pack(unpacked)
-    little_packed = formats.little_endian.pack(unpacked)[::-1]
-    packed_union = int(binascii.hexlify(big_packed), 16)
-    packed_union |= int(binascii.hexlify(little_packed), 16)
+    encoded = 0
 
-    return packed_union
+    if formats.big_endian is not None:
+        encoded = int.from_bytes(formats.big_endian.pack(unpacked), 'big')
+
+    # reading the little endian bytes as little endian does the byte
+    # reversal without making a reversed copy first
+    if formats.little_endian is not None:
+        encoded |= int.from_bytes(formats.little_endian.pack(unpacked), 'little')
+
+    return encoded
 
 
 def decode_data(data, fields, formats, decode_choices, scaling):
-    unpacked = formats.big_endian.unpack(bytes(data))
-    unpacked.update(formats.little_endian.unpack(bytes(data[::-1])))
+    data = bytes(data)
 
-    return {
-        field.name: _decode_field(
-            field, unpacked[field.name],
-            decode_choices, scaling)
-        for field in fields
-    }
+    # nearly every message uses a single byte order, the side without any
+    # signals has no format and the reversed copy is only made when needed
+    if formats.big_endian is None:
+        unpacked = {}
+    else:
+        unpacked = formats.big_endian.unpack(data)
+
+    if formats.little_endian is not None:
+        unpacked.update(formats.little_endian.unpack(data[::-1]))
+
+    # the flags are the same for every field so the loop is picked once,
+    # the fields are decoded inline instead of calling a helper for each
+    if not decode_choices:
+        if not scaling:
+            return {
+                field._name: unpacked[field._name]
+                for field in fields
+            }
+
+        return {
+            field._name: field._scale * unpacked[field._name] + field._offset
+            for field in fields
+        }
+
+    decoded = {}
+
+    for field in fields:
+        name = field._name
+        value = unpacked[name]
+
+        try:
+            decoded[name] = field._choices[value]
+            continue
+        except (KeyError, TypeError):
+            pass
+
+        if scaling:
+            value = field._scale * value + field._offset
+
+        decoded[name] = value
+
+    return decoded
+
+
+# the parts of a signal that the bitstruct formats depend on, used as the
+# key of the format cache so layouts shared by messages compile only once
+_FormatField = namedtuple(
+    '_FormatField',
+    ['name', 'start', 'length', 'byte_order', 'type']
+)
 
 
 def create_encode_decode_formats(datas, number_of_bytes):
-    format_length = (8 * number_of_bytes)
+    fields = tuple(
+        _FormatField(
+            data._name,
+            start_bit(data),
+            data._length,
+            data._byte_order,
+            'f' if data._is_float else 's' if data._is_signed else 'u'
+        )
+        for data in datas
+    )
 
-    def get_format_string_type(data):
-        if data.is_float:
-            return 'f'
-        elif data.is_signed:
-            return 's'
-        else:
-            return 'u'
+    return _create_formats(fields, number_of_bytes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _create_formats(datas, number_of_bytes):
+    format_length = (8 * number_of_bytes)
 
     def padding_item(length):
         fomt = 'p{}'.format(length)
@@ -138,10 +222,7 @@ def create_encode_decode_formats(datas, number_of_bytes):
         return fomt, pad_mask, None
 
     def data_item(data):
-        fomt = '{}{}'.format(
-            get_format_string_type(data),
-            data.length
-        )
+        fomt = '{}{}'.format(data.type, data.length)
         pad_mask = '0' * data.length
 
         return fomt, pad_mask, data.name
@@ -166,13 +247,14 @@ def create_encode_decode_formats(datas, number_of_bytes):
             if data.byte_order == 'little_endian':
                 continue
 
-            padding_length = (start_bit(data) - start)
+            # data.start already holds the start bit
+            padding_length = (data.start - start)
 
             if padding_length > 0:
                 items.append(padding_item(padding_length))
 
             items.append(data_item(data))
-            start = (start_bit(data) + data.length)
+            start = (data.start + data.length)
 
         if start < format_length:
             length = format_length - start
@@ -203,16 +285,25 @@ def create_encode_decode_formats(datas, number_of_bytes):
 
         if format_length > 0:
             length = len(''.join([item[1] for item in items]))
-            value = bitstruct.pack('u{}'.format(length), value)
-            value = int(binascii.hexlify(value[::-1]), 16)
+
+            # same as packing 'u<length>' with bitstruct and reading the
+            # bytes back in reverse order, without parsing a new format
+            value <<= -length % 8
+            value = int.from_bytes(value.to_bytes((length + 7) // 8, 'big'), 'little')
 
         return fmt(items), value, names(items)
 
     big_fmt, big_padding_mask, big_names = create_big()
     little_fmt, little_padding_mask, little_names = create_little()
 
-    big_compiled = bitstruct.compile(big_fmt, big_names)
-    little_compiled = bitstruct.compile(little_fmt, little_names)
+    big_compiled = None
+    little_compiled = None
+
+    if big_names:
+        big_compiled = bitstruct.compile(big_fmt, big_names)
+
+    if little_names:
+        little_compiled = bitstruct.compile(little_fmt, little_names)
 
     return Formats(
         big_compiled, little_compiled,